@@ -7,5 +7,6 @@ set -e
 python jobtracker/manage.py migrate --noinput
 
 # Start Gunicorn inside the Django project directory so settings load
-# correctly.
-exec gunicorn --chdir jobtracker jobtracker.wsgi:application --bind 0.0.0.0:${PORT:-8000}
+# correctly. Threads keep the worker responsive while a PDF export renders.
+exec gunicorn --chdir jobtracker jobtracker.wsgi:application --bind 0.0.0.0:${PORT:-8000} \
+    --threads 4 --timeout 120
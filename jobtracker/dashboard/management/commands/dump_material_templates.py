@@ -0,0 +1,26 @@
+from pathlib import Path
+
+from django.conf import settings
+from django.core.management.base import BaseCommand
+
+from dashboard.views import MATERIAL_TEMPLATES_JSON
+
+
+class Command(BaseCommand):
+    help = (
+        "Write the material templates to a static JSON file so a front-end "
+        "server or CDN can serve them without going through Django."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--output",
+            default=str(Path(settings.STATIC_ROOT) / "api" / "material_templates.json"),
+            help="File to write (default: STATIC_ROOT/api/material_templates.json)",
+        )
+
+    def handle(self, *args, **options):
+        output = Path(options["output"])
+        output.parent.mkdir(parents=True, exist_ok=True)
+        output.write_bytes(MATERIAL_TEMPLATES_JSON)
+        self.stdout.write(self.style.SUCCESS(f"Wrote material templates to {output}"))
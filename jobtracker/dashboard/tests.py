@@ -1,4 +1,9 @@
+import json
+import tempfile
+from datetime import date, datetime, timezone as dt_timezone
 from decimal import Decimal
+from io import StringIO
+from pathlib import Path
 from types import SimpleNamespace
 from unittest.mock import patch
 
@@ -7,7 +12,11 @@ from django.core.files.uploadedfile import SimpleUploadedFile
 from django.urls import reverse
 from django.templatetags.static import static
 from django.http import HttpResponse
+from django.core.cache import cache
+from django.core.management import call_command
+from django.db import connection
 from django.db.utils import OperationalError
+from django.test.utils import CaptureQueriesContext
 
 from dashboard.templatetags.estimate_extras import dedupe_qty
 
@@ -66,22 +75,87 @@ class DedupeQtyTests(TestCase):
         self.assertEqual(dedupe_qty(text), "Fill (6.5 Yards)")
 
 
+class SafeDecimalTests(TestCase):
+    def test_converts_and_falls_back(self):
+        value = Decimal("2.50")
+        self.assertIs(views.safe_decimal(value), value)
+        self.assertEqual(views.safe_decimal("3"), Decimal("3"))
+        self.assertEqual(views.safe_decimal(None), Decimal("0"))
+        self.assertEqual(views.safe_decimal("", Decimal("1")), Decimal("1"))
+
+
+class ProjectMathHelperTests(TestCase):
+    def test_week_starts_are_anchored_at_the_start_date(self):
+        self.assertEqual(
+            views._week_starts(date(2024, 1, 3), date(2024, 1, 17)),
+            [date(2024, 1, 3), date(2024, 1, 10), date(2024, 1, 17)],
+        )
+        self.assertEqual(views._week_starts(date(2024, 1, 3), date(2024, 1, 9)), [date(2024, 1, 3)])
+        self.assertEqual(views._week_starts(date(2024, 1, 3), date(2024, 1, 2)), [])
+
+    def test_percent_and_cost_split_handle_empty_totals(self):
+        self.assertEqual(views._percent(Decimal("25"), Decimal("200")), 12.5)
+        self.assertEqual(views._percent(Decimal("25"), Decimal("0")), 0)
+        self.assertEqual(views._cost_split(Decimal("30"), Decimal("120")), (25.0, 75.0))
+        self.assertEqual(views._cost_split(Decimal("30"), Decimal("0")), (0, 0))
+
+
+class GreetingTests(TestCase):
+    def test_greetings_cover_every_hour_with_the_old_boundaries(self):
+        self.assertEqual(len(views.GREETINGS), 24)
+        self.assertEqual(views.GREETINGS[11], "Good Morning")
+        self.assertEqual(views.GREETINGS[12], "Good Afternoon")
+        self.assertEqual(views.GREETINGS[17], "Good Afternoon")
+        self.assertEqual(views.GREETINGS[18], "Good Evening")
+
+
 class RenderPdfTests(TestCase):
+    def setUp(self):
+        views._get_pdf_template.cache_clear()
+        self.addCleanup(views._get_pdf_template.cache_clear)
+
     def test_render_pdf_generates_pdf(self):
         template = SimpleNamespace(render=lambda ctx: "<html></html>")
-        pdf_bytes = b"%PDF-1.4"
-        html_obj = SimpleNamespace(write_pdf=lambda: pdf_bytes)
+        html_obj = SimpleNamespace(write_pdf=lambda target: target.write(b"%PDF-1.4"))
         with patch("dashboard.views.get_template", return_value=template):
             with patch("dashboard.views.HTML", return_value=html_obj):
                 response = _render_pdf("tpl.html", {}, "out.pdf")
         assert response.status_code == 200
         assert response.content.startswith(b"%PDF")
 
+    def test_pdf_template_is_compiled_once(self):
+        with patch("dashboard.views.get_template") as get_template:
+            views._get_pdf_template("dashboard/customer_report.html")
+            views._get_pdf_template("dashboard/customer_report.html")
+        get_template.assert_called_once_with("dashboard/customer_report.html")
+
+    def test_render_pdf_template_error_returns_none(self):
+        with patch("dashboard.views.HTML", return_value=SimpleNamespace()):
+            with self.assertLogs("dashboard.views", "ERROR") as logs:
+                response = _render_pdf("dashboard/does_not_exist.html", {}, "out.pdf")
+        assert response is None
+        self.assertIn("dashboard/does_not_exist.html", logs.output[0])
+
     def test_render_pdf_missing_library_returns_none(self):
         with patch("dashboard.views.HTML", None):
             response = _render_pdf("tpl.html", {}, "out.pdf")
         assert response is None
 
+    def test_url_fetcher_reads_static_assets_from_disk(self):
+        fetched = []
+        with patch("dashboard.views.default_url_fetcher", side_effect=fetched.append):
+            views._pdf_url_fetcher(
+                "http://testserver/static/css/squire.css",
+                base_url="http://testserver/",
+            )
+            views._pdf_url_fetcher(
+                "https://cdn.example.com/static/app.css",
+                base_url="http://testserver/",
+            )
+        assert fetched[0].startswith("file://")
+        assert fetched[0].endswith("/static/css/squire.css")
+        assert fetched[1] == "https://cdn.example.com/static/app.css"
+
 class DashboardLogoTests(TestCase):
     def test_dashboard_displays_contractor_logo(self):
         """The contractor's logo should appear on the dashboard navbar."""
@@ -251,7 +325,11 @@ class CustomerReportPaymentsTests(TestCase):
         )
 
         url = reverse("dashboard:customer_report", args=[project.pk])
-        response = self.client.get(url)
+        self.client.get(url)
+        # session, user with its contractor, project, entries, payments, global
+        # settings; the totals are summed from the fetched rows.
+        with self.assertNumQueries(6):
+            response = self.client.get(url)
 
         self.assertContains(response, "$15")
         self.assertContains(response, "Outstanding Balance: $25")
@@ -271,6 +349,106 @@ class ContractorSummaryReportTests(TestCase):
         response = self.client.get(reverse("dashboard:contractor_report"))
         self.assertContains(response, "Contractor Summary Report")
 
+    def test_contractor_report_totals_refresh_after_new_entry(self):
+        cache.clear()
+        contractor = Contractor.objects.create(
+            name="Test Contractor", email="user@example.com"
+        )
+        ContractorUser.objects.create_user(
+            email="user@example.com", password="secret", contractor=contractor
+        )
+        asset = contractor.assets.create(
+            name="Excavator", cost_rate=Decimal("10"), billable_rate=Decimal("20")
+        )
+        project = contractor.projects.create(name="Job", start_date="2024-01-01")
+        JobEntry.objects.create(project=project, date="2024-01-02", hours=Decimal("1"), asset=asset)
+        self.client.post(
+            reverse("login"), {"username": "user@example.com", "password": "secret"}
+        )
+        url = reverse("dashboard:contractor_report")
+
+        self.assertEqual(self.client.get(url).context["total_revenue"], Decimal("20"))
+        JobEntry.objects.create(project=project, date="2024-01-03", hours=Decimal("1"), asset=asset)
+        self.assertEqual(self.client.get(url).context["total_revenue"], Decimal("40"))
+
+    def test_contractor_report_profit_buckets_and_average_margin(self):
+        cache.clear()
+        contractor = Contractor.objects.create(
+            name="Test Contractor", email="user@example.com"
+        )
+        ContractorUser.objects.create_user(
+            email="user@example.com", password="secret", contractor=contractor
+        )
+        good = contractor.assets.create(
+            name="Excavator", cost_rate=Decimal("10"), billable_rate=Decimal("20")
+        )
+        bad = contractor.assets.create(
+            name="Crane", cost_rate=Decimal("30"), billable_rate=Decimal("20")
+        )
+        for name, asset, hours in (("Big", good, "20"), ("Small", good, "5"), ("Loss", bad, "1")):
+            project = contractor.projects.create(name=name, start_date="2024-01-01")
+            JobEntry.objects.create(
+                project=project, date="2024-01-02", hours=Decimal(hours), asset=asset
+            )
+        contractor.projects.create(name="Idle", start_date="2024-01-01")
+        self.client.post(
+            reverse("login"), {"username": "user@example.com", "password": "secret"}
+        )
+
+        context = self.client.get(reverse("dashboard:contractor_report")).context
+
+        self.assertEqual(context["profitable_count"], 1)
+        self.assertEqual(context["breakeven_count"], 2)
+        self.assertEqual(context["unprofitable_count"], 1)
+        self.assertEqual(context["total_profit"], Decimal("240"))
+        # (50 + 50 - 50 + 0) / 4 projects
+        self.assertEqual(context["average_margin"], Decimal("12.5"))
+
+    def test_contractor_report_year_filter(self):
+        contractor = Contractor.objects.create(
+            name="Test Contractor", email="user@example.com"
+        )
+        ContractorUser.objects.create_user(
+            email="user@example.com", password="secret", contractor=contractor
+        )
+        asset = contractor.assets.create(
+            name="Excavator", cost_rate=Decimal("10"), billable_rate=Decimal("20")
+        )
+        old = contractor.projects.create(name="Old Job", start_date="2023-01-01")
+        new = contractor.projects.create(name="New Job", start_date="2024-01-01")
+        JobEntry.objects.create(project=old, date="2023-02-01", hours=Decimal("1"), asset=asset)
+        JobEntry.objects.create(project=new, date="2024-02-01", hours=Decimal("2"), asset=asset)
+        self.client.post(
+            reverse("login"), {"username": "user@example.com", "password": "secret"}
+        )
+
+        response = self.client.get(reverse("dashboard:contractor_report") + "?year=2024")
+
+        self.assertEqual([p.name for p in response.context["projects"]], ["New Job"])
+        self.assertEqual(response.context["project_count"], 1)
+        self.assertEqual(response.context["total_revenue"], Decimal("40"))
+
+    def test_contractor_report_ignores_out_of_range_year(self):
+        contractor = Contractor.objects.create(
+            name="Test Contractor", email="user@example.com"
+        )
+        ContractorUser.objects.create_user(
+            email="user@example.com", password="secret", contractor=contractor
+        )
+        contractor.projects.create(name="Job", start_date="2024-01-01")
+        self.client.post(
+            reverse("login"), {"username": "user@example.com", "password": "secret"}
+        )
+
+        for year in ("0", "10000"):
+            with self.subTest(year=year):
+                response = self.client.get(
+                    reverse("dashboard:contractor_report") + f"?year={year}"
+                )
+                self.assertEqual(response.status_code, 200)
+                self.assertEqual(response.context["year"], "")
+                self.assertEqual(response.context["project_count"], 1)
+
     def test_contractor_report_excludes_logo(self):
         logo_content = (
             b"\x47\x49\x46\x38\x39\x61\x01\x00\x01\x00\x80\x00\x00"
@@ -325,6 +503,30 @@ class ContractorJobReportTests(TestCase):
         self.assertContains(response, "$20")
         self.assertContains(response, "40.00%")
 
+    def test_contractor_job_report_does_not_load_deferred_columns_per_row(self):
+        contractor = Contractor.objects.create(
+            name="Test Contractor", email="user@example.com"
+        )
+        ContractorUser.objects.create_user(
+            email="user@example.com", password="secret", contractor=contractor
+        )
+        project = contractor.projects.create(name="Proj", start_date="2024-01-01")
+        asset = contractor.assets.create(
+            name="Excavator", cost_rate=Decimal("10"), billable_rate=Decimal("20")
+        )
+        for day in range(1, 6):
+            JobEntry.objects.create(
+                project=project, date=f"2024-01-0{day}", hours=Decimal("1"), asset=asset
+            )
+        self.client.post(
+            reverse("login"), {"username": "user@example.com", "password": "secret"}
+        )
+
+        # session, user with its contractor, project, entries, payments, global
+        # settings
+        with self.assertNumQueries(6):
+            self.client.get(reverse("dashboard:contractor_job_report", args=[project.pk]))
+
     def test_contractor_job_report_excludes_logo(self):
         logo_content = (
             b"\x47\x49\x46\x38\x39\x61\x01\x00\x01\x00\x80\x00\x00"
@@ -386,6 +588,7 @@ class ReportButtonPlacementTests(TestCase):
 
 class ContractorSummaryProjectTotalsTests(TestCase):
     def setUp(self):
+        cache.clear()
         self.contractor = Contractor.objects.create(
             name="Test Contractor", email="user@example.com"
         )
@@ -396,6 +599,17 @@ class ContractorSummaryProjectTotalsTests(TestCase):
             reverse("login"), {"username": "user@example.com", "password": "secret"}
         )
 
+    def test_contractor_is_loaded_with_the_user_not_per_lookup(self):
+        # The view, the contractor context processor and the template all read
+        # request.user.contractor; it arrives joined onto the session user.
+        self.client.get(reverse("dashboard:contractor_summary"))
+        with CaptureQueriesContext(connection) as queries:
+            self.client.get(reverse("dashboard:contractor_summary"))
+        contractor_fetches = [
+            q for q in queries if 'FROM "tracker_contractor" ' in q["sql"]
+        ]
+        self.assertEqual(contractor_fetches, [])
+
     def test_project_totals_display_correctly(self):
         asset = self.contractor.assets.create(
             name="Excavator", cost_rate=Decimal("10"), billable_rate=Decimal("20")
@@ -420,9 +634,145 @@ class ContractorSummaryProjectTotalsTests(TestCase):
         self.assertContains(response, "$13")
         self.assertContains(response, "$17")
 
+    def test_overall_totals_sum_active_project_annotations(self):
+        asset = self.contractor.assets.create(
+            name="Excavator", cost_rate=Decimal("10"), billable_rate=Decimal("20")
+        )
+        for name in ("First", "Second"):
+            project = self.contractor.projects.create(name=name, start_date="2024-01-01")
+            JobEntry.objects.create(
+                project=project, date="2024-01-02", hours=Decimal("1"), asset=asset
+            )
+            Payment.objects.create(project=project, amount=Decimal("5"), date="2024-01-04")
+        closed = self.contractor.projects.create(
+            name="Closed", start_date="2024-01-01", end_date="2024-02-01"
+        )
+        JobEntry.objects.create(
+            project=closed, date="2024-01-02", hours=Decimal("1"), asset=asset
+        )
+
+        # session, user with its contractor, projects version, annotated projects,
+        # recent entries, recent payments, global settings.
+        with self.assertNumQueries(7):
+            response = self.client.get(reverse("dashboard:contractor_summary"))
+
+        self.assertEqual(response.context["first_project"].name, "First")
+        self.assertEqual(response.context["overall_billable"], Decimal("40"))
+        self.assertEqual(response.context["overall_payments"], Decimal("10"))
+        self.assertEqual(response.context["outstanding"], Decimal("30"))
+
+    def test_summary_is_cached_until_an_entry_changes(self):
+        asset = self.contractor.assets.create(
+            name="Excavator", cost_rate=Decimal("10"), billable_rate=Decimal("20")
+        )
+        project = self.contractor.projects.create(name="Proj", start_date="2024-01-01")
+        JobEntry.objects.create(
+            project=project, date="2024-01-02", hours=Decimal("1"), asset=asset
+        )
+        url = reverse("dashboard:contractor_summary")
+        self.client.get(url)
+
+        # session, user with its contractor, projects version, global settings.
+        with self.assertNumQueries(4):
+            response = self.client.get(url)
+        self.assertEqual(response.context["overall_billable"], Decimal("20"))
+        self.assertEqual(len(response.context["recent_entries"]), 1)
+        self.assertContains(response, "Proj</div>")
+        self.assertContains(response, " - Excavator")
+
+        JobEntry.objects.create(
+            project=project, date="2024-01-03", hours=Decimal("2"), asset=asset
+        )
+        response = self.client.get(url)
+        self.assertEqual(response.context["overall_billable"], Decimal("60"))
+        self.assertEqual(len(response.context["recent_entries"]), 2)
+
+    def test_project_without_activity_has_zero_totals(self):
+        self.contractor.projects.create(name="Empty", start_date="2024-01-01")
+
+        response = self.client.get(reverse("dashboard:contractor_summary"))
+
+        project = response.context["projects"][0]
+        self.assertEqual(project.total_billable, Decimal("0"))
+        self.assertEqual(project.total_payments, Decimal("0"))
+        self.assertEqual(project.outstanding, Decimal("0"))
+
+    def test_project_list_totals_sum_annotated_projects(self):
+        asset = self.contractor.assets.create(
+            name="Excavator", cost_rate=Decimal("10"), billable_rate=Decimal("20")
+        )
+        for name in ("First", "Second"):
+            project = self.contractor.projects.create(name=name, start_date="2024-01-01")
+            JobEntry.objects.create(
+                project=project, date="2024-01-02", hours=Decimal("1"), asset=asset
+            )
+            JobEntry.objects.create(
+                project=project, date="2024-01-03", hours=Decimal("1"), asset=asset
+            )
+            Payment.objects.create(project=project, amount=Decimal("5"), date="2024-01-04")
+
+        # session, user with its contractor, annotated projects, global settings: the
+        # page totals come from the rows already fetched, not another query.
+        with self.assertNumQueries(4):
+            response = self.client.get(reverse("dashboard:project_list"))
+
+        self.assertEqual(
+            [p.total_billable for p in response.context["projects"]],
+            [Decimal("40"), Decimal("40")],
+        )
+        self.assertEqual(response.context["total_billable"], Decimal("80"))
+        self.assertEqual(response.context["total_payments"], Decimal("10"))
+        self.assertEqual(response.context["total_outstanding"], Decimal("70"))
+
+    def test_select_project_lists_active_projects_in_one_query(self):
+        asset = self.contractor.assets.create(
+            name="Excavator", cost_rate=Decimal("10"), billable_rate=Decimal("20")
+        )
+        project = self.contractor.projects.create(name="Active", start_date="2024-01-01")
+        JobEntry.objects.create(
+            project=project, date="2024-01-02", hours=Decimal("1"), asset=asset
+        )
+        Payment.objects.create(project=project, amount=Decimal("5"), date="2024-01-04")
+        self.contractor.projects.create(
+            name="Closed", start_date="2024-01-01", end_date="2024-02-01"
+        )
+
+        # session, user with its contractor, annotated projects, global settings.
+        with self.assertNumQueries(4):
+            response = self.client.get(reverse("dashboard:select_job_entry_project"))
+
+        self.assertEqual([p.name for p in response.context["projects"]], ["Active"])
+        self.assertEqual(response.context["projects"][0].outstanding, Decimal("15"))
+
+    def test_select_project_redirects_without_active_projects(self):
+        response = self.client.get(reverse("dashboard:select_payment_project"))
+        self.assertRedirects(response, reverse("dashboard:project_list"))
+
+    def test_project_list_search_matches_names_and_entry_descriptions(self):
+        by_name = self.contractor.projects.create(name="Gravel Pit", start_date="2024-01-01")
+        by_entry = self.contractor.projects.create(name="Driveway", start_date="2024-01-01")
+        self.contractor.projects.create(name="Fence", start_date="2024-01-01")
+        for _ in range(2):
+            JobEntry.objects.create(
+                project=by_entry,
+                date="2024-01-02",
+                hours=Decimal("1"),
+                material_description="Stone",
+                material_cost=Decimal("10"),
+                description="Spread gravel",
+            )
+
+        response = self.client.get(reverse("dashboard:project_list"), {"search": "gravel"})
+
+        self.assertEqual(
+            sorted(p.pk for p in response.context["projects"]),
+            sorted([by_name.pk, by_entry.pk]),
+        )
+
 
 class PdfExportTests(TestCase):
     def setUp(self):
+        cache.clear()
         self.contractor = Contractor.objects.create(
             name="Test Contractor", email="user@example.com"
         )
@@ -443,7 +793,7 @@ class PdfExportTests(TestCase):
         )
 
     def _fake_html(self, pdf_bytes=b"%PDF-1.4\n"):
-        return SimpleNamespace(write_pdf=lambda: pdf_bytes)
+        return SimpleNamespace(write_pdf=lambda target: target.write(pdf_bytes))
 
     @patch("dashboard.views.HTML")
     def test_contractor_report_pdf(self, mock_html):
@@ -483,14 +833,44 @@ class PdfExportTests(TestCase):
         self.assertIn(b"Contractor Summary", response.content)
 
     @patch("dashboard.views.HTML")
-    def test_pdf_with_leading_whitespace_is_trimmed(self, mock_html):
-        mock_html.side_effect = lambda *args, **kwargs: self._fake_html(b"\n%PDF-1.4\n")
-        response = self.client.get(
-            reverse("dashboard:contractor_report") + "?export=pdf"
+    def test_contractor_report_pdf_is_cached_until_data_changes(self, mock_html):
+        mock_html.side_effect = lambda *args, **kwargs: self._fake_html()
+        url = reverse("dashboard:contractor_report") + "?export=pdf"
+
+        self.client.get(url)
+        response = self.client.get(url)
+        self.assertEqual(mock_html.call_count, 1)
+        self.assertEqual(response.content, b"%PDF-1.4\n")
+        self.assertIn("contractor_summary_report.pdf", response["Content-Disposition"])
+
+        Payment.objects.create(project=self.project, amount=Decimal("5"), date="2024-01-03")
+        self.client.get(url)
+        self.assertEqual(mock_html.call_count, 2)
+
+    @patch("dashboard.views.HTML")
+    def test_contractor_report_pdf_is_rebuilt_after_a_contractor_rename(self, mock_html):
+        mock_html.side_effect = lambda *args, **kwargs: self._fake_html()
+        url = reverse("dashboard:contractor_report") + "?export=pdf"
+
+        self.client.get(url)
+        self.contractor.name = "Renamed Contractor"
+        self.contractor.save()
+        self.client.get(url)
+        self.assertEqual(mock_html.call_count, 2)
+
+    @patch("dashboard.views.HTML")
+    def test_small_pdf_writes_are_coalesced_into_the_response(self, mock_html):
+        def write_pdf(target):
+            target.write(b"%PDF-1.4\n")
+            target.write(b"%%EOF\n")
+
+        mock_html.return_value = SimpleNamespace(write_pdf=write_pdf)
+        url = reverse("dashboard:contractor_job_report", args=[self.project.pk])
+        response = self.client.get(url + "?export=pdf")
+        self.assertEqual(
+            [chunk for chunk in response if chunk], [b"%PDF-1.4\n%%EOF\n"]
         )
-        self.assertEqual(response.status_code, 200)
-        self.assertEqual(response["Content-Type"], "application/pdf")
-        self.assertTrue(response.content.startswith(b"%PDF"))
+        self.assertIn("contractor_job_report.pdf", response["Content-Disposition"])
 
 
 class JobEntryOrderingTests(TestCase):
@@ -605,6 +985,130 @@ class ProjectDetailPageTests(TestCase):
         )
         self.assertNotContains(response, '<nav aria-label="breadcrumb"')
 
+    def test_weekly_data_buckets_entries_from_project_start(self):
+        asset = self.contractor.assets.create(
+            name="Excavator", cost_rate=Decimal("10"), billable_rate=Decimal("20")
+        )
+        JobEntry.objects.create(
+            project=self.project, date="2024-01-02", hours=Decimal("1"), asset=asset
+        )
+        JobEntry.objects.create(
+            project=self.project, date="2024-01-07", hours=Decimal("2"), asset=asset
+        )
+        JobEntry.objects.create(
+            project=self.project, date="2024-01-08", hours=Decimal("3"), asset=asset
+        )
+        self.client.post(
+            reverse("login"), {"username": "user@example.com", "password": "secret"}
+        )
+
+        response = self.client.get(
+            reverse("dashboard:project_detail", args=[self.project.pk])
+        )
+
+        weekly = response.context["weekly_data"]
+        self.assertEqual(weekly[0], {"week": "Jan 01", "hours": 3.0, "billable": 60.0, "cost": 30.0})
+        self.assertEqual(weekly[1], {"week": "Jan 08", "hours": 3.0, "billable": 60.0, "cost": 30.0})
+        self.assertEqual(weekly[2]["billable"], 0.0)
+
+    def test_weekly_data_skips_entries_outside_the_project_weeks(self):
+        asset = self.contractor.assets.create(
+            name="Excavator", cost_rate=Decimal("10"), billable_rate=Decimal("20")
+        )
+        # Before the project start would otherwise land in a negative bucket
+        # and wrap around to the last week.
+        JobEntry.objects.create(
+            project=self.project, date="2023-12-25", hours=Decimal("1"), asset=asset
+        )
+        JobEntry.objects.create(
+            project=self.project, date="2024-01-03", hours=Decimal("2"), asset=asset
+        )
+        self.client.post(
+            reverse("login"), {"username": "user@example.com", "password": "secret"}
+        )
+
+        response = self.client.get(
+            reverse("dashboard:project_detail", args=[self.project.pk])
+        )
+
+        weekly = response.context["weekly_data"]
+        self.assertEqual(weekly[0]["billable"], 40.0)
+        self.assertEqual(sum(week["billable"] for week in weekly), 40.0)
+        self.assertEqual(response.context["total_billable"], Decimal("60"))
+
+    def test_timeline_merges_entries_and_payments_newest_first(self):
+        asset = self.contractor.assets.create(
+            name="Excavator", cost_rate=Decimal("10"), billable_rate=Decimal("20")
+        )
+        for day in ("2024-01-02", "2024-01-04", "2024-01-04"):
+            JobEntry.objects.create(
+                project=self.project, date=day, hours=Decimal("1"), asset=asset
+            )
+        for day in ("2024-01-03", "2024-01-04"):
+            Payment.objects.create(project=self.project, amount=Decimal("5"), date=day)
+        self.client.post(
+            reverse("login"), {"username": "user@example.com", "password": "secret"}
+        )
+
+        response = self.client.get(
+            reverse("dashboard:project_detail", args=[self.project.pk])
+        )
+
+        timeline = []
+        for item in response.context["timeline_items"]:
+            kind = "entries" if "entries" in item else "payments"
+            timeline.append((str(item["date"]), kind, len(item[kind])))
+        self.assertEqual(
+            timeline,
+            [
+                ("2024-01-04", "entries", 2),
+                ("2024-01-04", "payments", 1),
+                ("2024-01-03", "payments", 1),
+                ("2024-01-02", "entries", 1),
+            ],
+        )
+
+    def test_entries_and_payments_are_each_loaded_once(self):
+        asset = self.contractor.assets.create(
+            name="Excavator", cost_rate=Decimal("10"), billable_rate=Decimal("20")
+        )
+        for day in range(1, 6):
+            JobEntry.objects.create(
+                project=self.project, date=f"2024-01-0{day}", hours=Decimal("1"), asset=asset
+            )
+            Payment.objects.create(
+                project=self.project, amount=Decimal("5"), date=f"2024-01-0{day}"
+            )
+        self.client.post(
+            reverse("login"), {"username": "user@example.com", "password": "secret"}
+        )
+
+        # session, user with its contractor, project, payments, entries, global settings
+        with self.assertNumQueries(6):
+            response = self.client.get(
+                reverse("dashboard:project_detail", args=[self.project.pk])
+            )
+        self.assertEqual(response.context["total_billable"], Decimal("100"))
+
+    def test_payment_table_is_capped_but_totals_and_timeline_are_not(self):
+        for day in range(1, 13):
+            Payment.objects.create(
+                project=self.project, amount=Decimal("5"), date=f"2024-01-{day:02d}"
+            )
+        self.client.post(
+            reverse("login"), {"username": "user@example.com", "password": "secret"}
+        )
+
+        response = self.client.get(
+            reverse("dashboard:project_detail", args=[self.project.pk])
+        )
+
+        payments = response.context["payments"]
+        self.assertEqual(len(payments), 10)
+        self.assertEqual(str(payments[0].date), "2024-01-12")
+        self.assertEqual(response.context["total_payments"], Decimal("60"))
+        self.assertEqual(len(response.context["timeline_items"]), 12)
+
 
 class ProjectDetailRobustnessTests(TestCase):
     def test_project_detail_handles_bad_numeric_data(self):
@@ -637,9 +1141,48 @@ class ProjectDetailRobustnessTests(TestCase):
         response = self.client.get(url, HTTP_HOST="localhost")
         self.assertEqual(response.status_code, 200)
 
+    def test_failed_analytics_pass_keeps_stored_billable_totals(self):
+        contractor = Contractor.objects.create(
+            name="Test Contractor", email="user2@example.com"
+        )
+        user = ContractorUser.objects.create_user(
+            email="user2@example.com", password="secret", contractor=contractor
+        )
+        project = contractor.projects.create(name="Proj", start_date="2024-01-01")
+        asset = contractor.assets.create(
+            name="Excavator", cost_rate=Decimal("10"), billable_rate=Decimal("20")
+        )
+        # The newest row is accumulated first; the older material row then
+        # fails on the unusable margin part way through the pass.
+        JobEntry.objects.create(
+            project=project, date="2024-01-03", hours=Decimal("1"), asset=asset
+        )
+        JobEntry.objects.create(
+            project=project,
+            date="2024-01-02",
+            hours=Decimal("1"),
+            material_description="Gravel",
+            material_cost=Decimal("5"),
+            service_markup=Decimal("10"),
+        )
+        Payment.objects.create(project=project, amount=Decimal("10"), date="2024-01-04")
+        self.client.force_login(user)
+        url = reverse("dashboard:project_detail", args=[project.pk])
+        with patch("dashboard.views.safe_decimal", return_value=Decimal("NaN")):
+            with self.assertLogs("dashboard.views", "ERROR"):
+                response = self.client.get(url)
+        self.assertEqual(response.status_code, 200)
+        # Billable and outstanding come from the stored amounts; only the
+        # derived breakdowns fall back to zero.
+        self.assertEqual(response.context["total_billable"], Decimal("25.50"))
+        self.assertEqual(response.context["outstanding"], Decimal("15.50"))
+        self.assertEqual(response.context["total_hours"], 0)
+        self.assertFalse(any(week["billable"] for week in response.context["weekly_data"]))
+
 
 class ProjectAnalyticsHoursTests(TestCase):
     def setUp(self):
+        cache.clear()
         self.contractor = Contractor.objects.create(
             name="Test Contractor", email="user@example.com"
         )
@@ -701,6 +1244,149 @@ class ProjectAnalyticsHoursTests(TestCase):
         response = self.client.get(url)
         self.assertEqual(response.context["total_hours"], Decimal("7"))
 
+    def test_analytics_data_groups_weeks_and_categories(self):
+        JobEntry.objects.create(
+            project=self.project, date="2024-01-02", hours=Decimal("2"), asset=self.asset
+        )
+        JobEntry.objects.create(
+            project=self.project,
+            date="2024-01-09",
+            hours=Decimal("1"),
+            employee=self.employee,
+        )
+        JobEntry.objects.create(
+            project=self.project,
+            date="2024-01-03",
+            hours=Decimal("5"),
+            material_description="Pipe",
+            material_cost=Decimal("5"),
+        )
+        # Before the project start: counted in the totals, not in any week.
+        JobEntry.objects.create(
+            project=self.project, date="2023-12-20", hours=Decimal("1"), asset=self.asset
+        )
+        url = reverse("dashboard:project_analytics", args=[self.project.pk])
+
+        # session, user with its contractor, project, then one GROUP BY for the weeks,
+        # categories and totals; no entry rows are loaded as models.
+        with self.assertNumQueries(4):
+            data = self.client.get(url).json()
+
+        self.assertEqual(
+            data["weekly_data"][0],
+            {"week": "Jan 01", "hours": 2.0, "billable": 40.0, "cost": 20.0},
+        )
+        self.assertEqual(
+            data["weekly_data"][1],
+            {"week": "Jan 08", "hours": 1.0, "billable": 30.0, "cost": 15.0},
+        )
+        self.assertEqual(
+            data["category_breakdown"],
+            {"labor": 30.0, "equipment": 60.0, "materials": 25.0},
+        )
+        self.assertEqual(data["totals"], {"billable": 115.0, "cost": 70.0})
+
+    def test_analytics_data_for_an_empty_future_project_is_all_zeros(self):
+        project = self.contractor.projects.create(name="Later", start_date="2999-01-01")
+        url = reverse("dashboard:project_analytics", args=[project.pk])
+        self.client.get(reverse("dashboard:project_analytics", args=[self.project.pk]))
+
+        # session, user with its contractor, project, then the GROUP BY itself:
+        # on an empty project it is as cheap as an EXISTS probe would be.
+        with self.assertNumQueries(4):
+            data = self.client.get(url).json()
+
+        self.assertEqual(data["weekly_data"], [])
+        self.assertEqual(
+            data["category_breakdown"], {"labor": 0.0, "equipment": 0.0, "materials": 0.0}
+        )
+        self.assertEqual(data["totals"], {"billable": 0.0, "cost": 0.0})
+
+    def test_analytics_data_answers_conditional_requests_until_an_entry_changes(self):
+        JobEntry.objects.create(
+            project=self.project, date="2024-01-02", hours=Decimal("2"), asset=self.asset
+        )
+        url = reverse("dashboard:project_analytics", args=[self.project.pk])
+        etag = self.client.get(url)["ETag"]
+
+        # session, user with its contractor, project: no rollup or encoding.
+        with self.assertNumQueries(3):
+            response = self.client.get(url, HTTP_IF_NONE_MATCH=etag)
+        self.assertEqual(response.status_code, 304)
+
+        JobEntry.objects.create(
+            project=self.project, date="2024-01-03", hours=Decimal("1"), asset=self.asset
+        )
+        response = self.client.get(url, HTTP_IF_NONE_MATCH=etag)
+        self.assertEqual(response.status_code, 200)
+        self.assertNotEqual(response["ETag"], etag)
+
+    def test_analytics_data_is_cached_until_an_entry_changes(self):
+        JobEntry.objects.create(
+            project=self.project, date="2024-01-02", hours=Decimal("2"), asset=self.asset
+        )
+        url = reverse("dashboard:project_analytics", args=[self.project.pk])
+        self.client.get(url)
+
+        # session, user with its contractor, project (whose updated_at keys the cache)
+        with self.assertNumQueries(3):
+            data = self.client.get(url).json()
+        self.assertEqual(data["totals"]["billable"], 40.0)
+
+        JobEntry.objects.create(
+            project=self.project, date="2024-01-03", hours=Decimal("1"), asset=self.asset
+        )
+        self.assertEqual(self.client.get(url).json()["totals"]["billable"], 60.0)
+
+    def test_analytics_weeks_are_dense_and_stop_at_today(self):
+        JobEntry.objects.create(
+            project=self.project, date="2024-01-02", hours=Decimal("2"), asset=self.asset
+        )
+        JobEntry.objects.create(
+            project=self.project, date="2024-01-23", hours=Decimal("1"), asset=self.asset
+        )
+        url = reverse("dashboard:project_analytics", args=[self.project.pk])
+        now = "dashboard.views.timezone.now"
+        with patch(now, return_value=datetime(2024, 1, 16, tzinfo=dt_timezone.utc)):
+            data = self.client.get(url).json()
+
+        # Jan 01, Jan 08 (empty) and Jan 15; the Jan 23 entry is after today
+        # so it only shows up in the totals.
+        self.assertEqual([w["week"] for w in data["weekly_data"]], ["Jan 01", "Jan 08", "Jan 15"])
+        self.assertEqual([w["hours"] for w in data["weekly_data"]], [2.0, 0.0, 0.0])
+        self.assertEqual(data["totals"]["billable"], 60.0)
+
+    def test_analytics_cache_notices_edits_and_deletes(self):
+        entry = JobEntry.objects.create(
+            project=self.project, date="2024-01-02", hours=Decimal("2"), asset=self.asset
+        )
+        url = reverse("dashboard:project_analytics", args=[self.project.pk])
+        self.assertEqual(self.client.get(url).json()["totals"]["billable"], 40.0)
+
+        # Neither change moves the highest entry id, but both bump the project.
+        entry.hours = Decimal("3")
+        entry.save()
+        self.assertEqual(self.client.get(url).json()["totals"]["billable"], 60.0)
+
+        entry.delete()
+        self.assertEqual(self.client.get(url).json()["totals"]["billable"], 0.0)
+
+    def test_cached_rollup_is_reused_when_the_week_range_grows(self):
+        JobEntry.objects.create(
+            project=self.project, date="2024-01-02", hours=Decimal("2"), asset=self.asset
+        )
+        url = reverse("dashboard:project_analytics", args=[self.project.pk])
+        now = "dashboard.views.timezone.now"
+        with patch(now, return_value=datetime(2024, 1, 10, tzinfo=dt_timezone.utc)):
+            weeks = self.client.get(url).json()["weekly_data"]
+        self.assertEqual(len(weeks), 2)
+
+        # A later day shows more weeks without recomputing the rollup.
+        with patch(now, return_value=datetime(2024, 1, 20, tzinfo=dt_timezone.utc)):
+            with self.assertNumQueries(3):
+                weeks = self.client.get(url).json()["weekly_data"]
+        self.assertEqual([w["hours"] for w in weeks], [2.0, 0.0, 0.0])
+
 
 class JobEstimateReportTests(TestCase):
     def setUp(self):
@@ -738,7 +1424,11 @@ class JobEstimateReportTests(TestCase):
 
         self.client.force_login(self.user)
         url = reverse("dashboard:job_estimate_report", args=[self.estimate.pk])
-        response = self.client.get(url)
+        self.client.get(url)
+        # session, user with its contractor, estimate, the fused totals, global
+        # settings.
+        with self.assertNumQueries(5):
+            response = self.client.get(url)
         self.assertContains(response, "$40.00")
         self.assertContains(response, "$5.00")
         self.assertContains(response, "$45.00")
@@ -746,6 +1436,59 @@ class JobEstimateReportTests(TestCase):
         self.assertContains(response, "$20.00")
         self.assertContains(response, "44.44%")
 
+    def test_estimate_reports_group_line_items(self):
+        employee = self.contractor.employees.create(
+            name="Operator", cost_rate=Decimal("15"), billable_rate=Decimal("30")
+        )
+        for index in range(3):
+            EstimateEntry.objects.create(
+                estimate=self.estimate,
+                date="2024-01-02",
+                hours=Decimal("1"),
+                asset=self.asset if index % 2 else None,
+                employee=None if index % 2 else employee,
+                cost_amount=Decimal("10"),
+                billable_amount=Decimal("20"),
+            )
+        EstimateEntry.objects.create(
+            estimate=self.estimate,
+            date="2024-01-03",
+            hours=Decimal("1"),
+            description="Material: Pipe",
+            material_description="Pipe",
+            material_cost=Decimal("5"),
+            cost_amount=Decimal("5"),
+            billable_amount=Decimal("6"),
+        )
+        EstimateEntry.objects.create(
+            estimate=self.estimate,
+            date="2024-01-03",
+            hours=Decimal("1"),
+            description="Outside Service: Survey",
+            material_description="Survey",
+            material_cost=Decimal("100"),
+            cost_amount=Decimal("100"),
+            billable_amount=Decimal("120"),
+        )
+
+        self.client.force_login(self.user)
+        response = self.client.get(
+            reverse("dashboard:customer_estimate_report", args=[self.estimate.pk])
+        )
+        self.assertEqual(response.context["labor_equipment_total"], Decimal("80"))
+        self.assertEqual(response.context["materials_total"], Decimal("5"))
+        self.assertEqual(response.context["services_total"], Decimal("100"))
+        self.assertEqual(response.context["grand_total"], Decimal("185"))
+        self.assertContains(response, "Pipe")
+        self.assertContains(response, "Survey")
+
+        url = reverse("dashboard:internal_estimate_report", args=[self.estimate.pk])
+        with self.assertNumQueries(5):
+            response = self.client.get(url)
+        self.assertEqual(response.context["labor_billable"], Decimal("60"))
+        self.assertEqual(response.context["equipment_billable"], Decimal("20"))
+        self.assertEqual(response.context["service_billable"], Decimal("100"))
+
 
 class EstimateListTests(TestCase):
     def setUp(self):
@@ -778,6 +1521,30 @@ class EstimateListTests(TestCase):
         self.assertContains(response, "$20.00")
         self.assertContains(response, "50.00%")
 
+    def test_estimate_list_sums_entry_amounts_in_one_query(self):
+        other = self.contractor.estimates.create(name="Other", created_date="2024-01-01")
+        for _ in range(3):
+            EstimateEntry.objects.create(
+                estimate=other,
+                date="2024-01-02",
+                hours=Decimal("1"),
+                asset=self.asset,
+            )
+        self.client.force_login(self.user)
+        url = reverse("dashboard:estimate_list")
+        self.client.get(url)  # first request runs the pending-migration check
+
+        # session, user with its contractor, estimates with their summed
+        # entries, global settings: no entry rows are loaded.
+        with self.assertNumQueries(4):
+            response = self.client.get(url)
+
+        self.assertEqual(response.context["total_value"], Decimal("100"))
+        listed = {est.name: est for est in response.context["estimates"]}
+        self.assertEqual(listed["Other"].display_total_billable, Decimal("60"))
+        self.assertEqual(listed["Other"].display_total_profit, Decimal("30"))
+        self.assertEqual(listed["Other"].display_profit_margin, Decimal("50"))
+
     def test_add_estimate_creates_record(self):
         self.client.force_login(self.user)
         url = reverse("dashboard:estimate_list")
@@ -797,6 +1564,29 @@ class EstimateListTests(TestCase):
             self.contractor.projects.filter(name="Estimate").exists()
         )
 
+    def test_accept_estimate_writes_entries_in_one_insert_with_amounts(self):
+        EstimateEntry.objects.create(
+            estimate=self.estimate,
+            date="2024-01-03",
+            hours=Decimal("1"),
+            material_description="Pipe",
+            material_cost=Decimal("5"),
+        )
+        self.client.force_login(self.user)
+        url = reverse("dashboard:accept_estimate", args=[self.estimate.pk])
+
+        with CaptureQueriesContext(connection) as queries:
+            self.client.post(url)
+
+        inserts = [q for q in queries if q["sql"].startswith('INSERT INTO "tracker_jobentry"')]
+        self.assertEqual(len(inserts), 1)
+        project = self.contractor.projects.get(name="Estimate")
+        entries = list(project.job_entries.order_by("date"))
+        self.assertEqual(
+            [(e.cost_amount, e.billable_amount) for e in entries],
+            [(Decimal("20"), Decimal("40")), (Decimal("5"), Decimal("5"))],
+        )
+
 
 class ProjectEstimateCRUDTests(TestCase):
     def setUp(self):
@@ -846,6 +1636,207 @@ class ProjectEstimateCRUDTests(TestCase):
         self.assertRedirects(response, reverse("dashboard:estimate_list"))
         self.assertTrue(self.contractor.estimates.filter(name="NoDate").exists())
 
+    def test_create_estimate_writes_rows_with_amounts(self):
+        asset = self.contractor.assets.create(
+            name="Excavator", cost_rate=Decimal("10"), billable_rate=Decimal("20")
+        )
+        self.client.post(
+            reverse("dashboard:create_estimate"),
+            {
+                "name": "WithRows",
+                "customer_name": "Customer",
+                "project_location": "Site",
+                "created_date": "2024-01-01",
+                "hours[]": ["3", "2"],
+                "asset[]": [str(asset.pk)] * 2,
+                "employee[]": ["", ""],
+                "description[]": ["Digging", "Grading"],
+                "service_description[]": ["Survey"],
+                "service_quantity[]": ["1"],
+                "service_unit[]": [""],
+                "service_cost[]": ["100"],
+                "service_markup[]": ["10"],
+            },
+        )
+
+        estimate = self.contractor.estimates.get(name="WithRows")
+        self.assertEqual(estimate.entries.count(), 3)
+        self.assertEqual(
+            sorted(estimate.entries.values_list("billable_amount", flat=True)),
+            [Decimal("40.00"), Decimal("60.00"), Decimal("110.00")],
+        )
+
+    def test_failed_edit_estimate_leaves_the_estimate_unchanged(self):
+        estimate = self.contractor.estimates.create(name="Est", created_date="2024-01-01")
+        asset = self.contractor.assets.create(
+            name="Excavator", cost_rate=Decimal("10"), billable_rate=Decimal("20")
+        )
+        kept = estimate.entries.create(date="2024-01-01", hours=Decimal("1"), asset=asset)
+        with patch.object(
+            EstimateEntry.objects, "bulk_create", side_effect=OperationalError
+        ):
+            self.client.post(
+                reverse("dashboard:edit_estimate", args=[estimate.pk]),
+                {
+                    "name": "Renamed",
+                    "customer_name": "Customer",
+                    "project_location": "Site",
+                    "created_date": "2024-01-01",
+                    "hours[]": ["2", "4"],
+                    "asset[]": [str(asset.pk)] * 2,
+                    "employee[]": ["", ""],
+                    "description[]": ["", "New"],
+                    "entry_id[]": [str(kept.pk), ""],
+                },
+            )
+
+        estimate.refresh_from_db()
+        kept.refresh_from_db()
+        self.assertEqual(estimate.name, "Est")
+        self.assertEqual(kept.hours, Decimal("1"))
+
+    def test_duplicate_estimate_copies_rows(self):
+        estimate = self.contractor.estimates.create(name="Est", created_date="2024-01-01")
+        asset = self.contractor.assets.create(
+            name="Excavator", cost_rate=Decimal("10"), billable_rate=Decimal("20")
+        )
+        estimate.entries.create(date="2024-01-01", hours=Decimal("2"), asset=asset)
+        self.client.post(reverse("dashboard:duplicate_estimate", args=[estimate.pk]))
+
+        duplicate = self.contractor.estimates.get(name="Est (Copy)")
+        self.assertEqual(
+            list(duplicate.entries.values_list("billable_amount", flat=True)),
+            [Decimal("40.00")],
+        )
+
+    def test_failed_duplicate_estimate_leaves_no_empty_copy(self):
+        estimate = self.contractor.estimates.create(name="Est", created_date="2024-01-01")
+        with patch.object(
+            EstimateEntry.objects, "bulk_create", side_effect=OperationalError
+        ):
+            with self.assertRaises(OperationalError):
+                self.client.post(
+                    reverse("dashboard:duplicate_estimate", args=[estimate.pk])
+                )
+
+        self.assertFalse(self.contractor.estimates.filter(name="Est (Copy)").exists())
+
+    def test_edit_estimate_keeps_newly_added_rows(self):
+        estimate = self.contractor.estimates.create(name="Est", created_date="2024-01-01")
+        asset = self.contractor.assets.create(
+            name="Excavator", cost_rate=Decimal("10"), billable_rate=Decimal("20")
+        )
+        kept = estimate.entries.create(date="2024-01-01", hours=Decimal("1"), asset=asset)
+        removed = estimate.entries.create(date="2024-01-01", hours=Decimal("5"), asset=asset)
+        self.client.post(
+            reverse("dashboard:edit_estimate", args=[estimate.pk]),
+            {
+                "name": "Est",
+                "customer_name": "Customer",
+                "project_location": "Site",
+                "created_date": "2024-01-01",
+                "hours[]": ["2", "4"],
+                "asset[]": [str(asset.pk)] * 2,
+                "employee[]": ["", ""],
+                "description[]": ["", "New"],
+                "entry_id[]": [str(kept.pk), ""],
+            },
+        )
+
+        self.assertFalse(estimate.entries.filter(pk=removed.pk).exists())
+        self.assertEqual(
+            sorted(estimate.entries.values_list("billable_amount", flat=True)),
+            [Decimal("40.00"), Decimal("80.00")],
+        )
+
+    def test_edit_estimate_loads_posted_rows_in_one_query(self):
+        estimate = self.contractor.estimates.create(name="Est", created_date="2024-01-01")
+        asset = self.contractor.assets.create(
+            name="Excavator", cost_rate=Decimal("10"), billable_rate=Decimal("20")
+        )
+        entries = [
+            estimate.entries.create(date="2024-01-01", hours=Decimal(n), asset=asset)
+            for n in (1, 2, 3)
+        ]
+        url = reverse("dashboard:edit_estimate", args=[estimate.pk])
+        data = {
+            "name": "Est",
+            "customer_name": "Customer",
+            "project_location": "Site",
+            "created_date": "2024-01-01",
+            "hours[]": ["4", "5", "6"],
+            "asset[]": [str(asset.pk)] * 3,
+            "employee[]": ["", "", ""],
+            "description[]": ["", "", ""],
+            "entry_id[]": [str(entry.pk) for entry in entries],
+        }
+        self.client.get(url)
+        with CaptureQueriesContext(connection) as queries:
+            self.client.post(url, data)
+        entry_selects = [
+            q["sql"]
+            for q in queries.captured_queries
+            if q["sql"].startswith("SELECT") and "tracker_estimateentry" in q["sql"]
+        ]
+        self.assertEqual(len(entry_selects), 1)
+        self.assertEqual(
+            sorted(estimate.entries.values_list("hours", flat=True)),
+            [Decimal("4"), Decimal("5"), Decimal("6")],
+        )
+
+    def test_add_estimate_entry_creates_rows_with_amounts(self):
+        estimate = self.contractor.estimates.create(name="Est", created_date="2024-01-01")
+        asset = self.contractor.assets.create(
+            name="Excavator", cost_rate=Decimal("10"), billable_rate=Decimal("20")
+        )
+        response = self.client.post(
+            reverse("dashboard:add_estimate_entry", args=[estimate.pk]),
+            {
+                "date": "2024-01-02",
+                "hours[]": ["3"],
+                "asset[]": [str(asset.pk)],
+                "employee[]": [""],
+                "description[]": ["Digging"],
+                "service_description[]": ["Survey"],
+                "service_quantity[]": ["1"],
+                "service_unit[]": [""],
+                "service_cost[]": ["100"],
+                "service_markup[]": ["10"],
+            },
+        )
+        self.assertRedirects(response, reverse("dashboard:estimate_list"))
+
+        labor = estimate.entries.get(asset=asset)
+        self.assertEqual(labor.cost_amount, Decimal("30.00"))
+        self.assertEqual(labor.billable_amount, Decimal("60.00"))
+        service = estimate.entries.get(asset__isnull=True)
+        self.assertEqual(service.cost_amount, Decimal("100.00"))
+        self.assertEqual(service.billable_amount, Decimal("110.00"))
+
+    def test_add_estimate_entry_reuses_request_contractor(self):
+        estimate = self.contractor.estimates.create(name="Est", created_date="2024-01-01")
+        asset = self.contractor.assets.create(
+            name="Excavator", cost_rate=Decimal("10"), billable_rate=Decimal("20")
+        )
+        data = {
+            "date": "2024-01-02",
+            "hours[]": ["3"],
+            "asset[]": [str(asset.pk)],
+            "employee[]": [""],
+            "description[]": ["Digging"],
+            "service_description[]": ["Survey"],
+            "service_quantity[]": ["1"],
+            "service_unit[]": [""],
+            "service_cost[]": ["100"],
+            "service_markup[]": ["10"],
+        }
+        # Amount calculation reads estimate.contractor; loading the estimate
+        # through contractor.estimates means that never costs a query.
+        with self.assertNumQueries(7):
+            self.client.post(
+                reverse("dashboard:add_estimate_entry", args=[estimate.pk]), data
+            )
+
 
 class EstimateReportLogoTests(TestCase):
     def setUp(self):
@@ -897,3 +1888,264 @@ class EstimateReportLogoTests(TestCase):
         )
         logo = self._capture_logo(url)
         self.assertTrue(logo.startswith("file://"))
+
+
+class AddJobEntryTests(TestCase):
+    def setUp(self):
+        self.contractor = Contractor.objects.create(
+            name="Test Contractor", email="user@example.com", material_margin=Decimal("20")
+        )
+        ContractorUser.objects.create_user(
+            email="user@example.com", password="secret", contractor=self.contractor
+        )
+        self.project = self.contractor.projects.create(
+            name="Proj", start_date="2024-01-01"
+        )
+        self.asset = self.contractor.assets.create(
+            name="Excavator", cost_rate=Decimal("10"), billable_rate=Decimal("20")
+        )
+        self.client.post(
+            reverse("login"), {"username": "user@example.com", "password": "secret"}
+        )
+
+    def test_labor_and_material_rows_are_created_with_amounts(self):
+        url = reverse("dashboard:add_job_entry", args=[self.project.pk])
+        response = self.client.post(
+            url,
+            {
+                "date": "2024-01-02",
+                "hours[]": ["2", ""],
+                "asset[]": [str(self.asset.pk), ""],
+                "employee[]": ["", ""],
+                "description[]": ["Digging", ""],
+                "material_description[]": ["Gravel"],
+                "material_quantity[]": ["4"],
+                "material_unit[]": ["Tons"],
+                "material_cost[]": ["10"],
+            },
+        )
+        self.assertRedirects(
+            response, reverse("dashboard:project_detail", args=[self.project.pk])
+        )
+
+        labor = JobEntry.objects.get(project=self.project, asset=self.asset)
+        self.assertEqual(labor.cost_amount, Decimal("20.00"))
+        self.assertEqual(labor.billable_amount, Decimal("40.00"))
+
+        material = JobEntry.objects.get(project=self.project, asset__isnull=True)
+        self.assertEqual(material.material_description, "Gravel (4 Tons)")
+        self.assertEqual(material.cost_amount, Decimal("40.00"))
+        self.assertEqual(material.billable_amount, Decimal("50.00"))
+
+    def test_rows_are_written_in_one_insert_inside_a_transaction(self):
+        url = reverse("dashboard:add_job_entry", args=[self.project.pk])
+        data = {
+            "date": "2024-01-02",
+            "hours[]": ["2", "3", "4"],
+            "asset[]": [str(self.asset.pk)] * 3,
+            "employee[]": ["", "", ""],
+            "description[]": ["", "", ""],
+        }
+        # session, user with its contractor, project, the posted asset (no
+        # employees were posted, so none are fetched), then SAVEPOINT / INSERT /
+        # project touch / RELEASE for the atomic bulk insert.
+        with self.assertNumQueries(8):
+            self.client.post(url, data)
+        self.assertEqual(JobEntry.objects.filter(project=self.project).count(), 3)
+
+    def test_rows_missing_a_trailing_column_are_kept(self):
+        url = reverse("dashboard:add_job_entry", args=[self.project.pk])
+        self.client.post(
+            url,
+            {
+                "date": "2024-01-02",
+                "hours[]": ["2", "3"],
+                "asset[]": [str(self.asset.pk)] * 2,
+                "employee[]": [""],
+            },
+        )
+        self.assertEqual(JobEntry.objects.filter(project=self.project).count(), 2)
+
+    def test_invalid_number_rejects_the_whole_submission(self):
+        url = reverse("dashboard:add_job_entry", args=[self.project.pk])
+        response = self.client.post(
+            url,
+            {
+                "date": "2024-01-02",
+                "hours[]": ["2"],
+                "asset[]": [str(self.asset.pk)],
+                "employee[]": [""],
+                "description[]": ["Digging"],
+                "material_description[]": ["Gravel"],
+                "material_quantity[]": ["four"],
+                "material_unit[]": ["Tons"],
+                "material_cost[]": ["10"],
+            },
+        )
+        self.assertRedirects(response, url)
+        self.assertFalse(JobEntry.objects.filter(project=self.project).exists())
+
+    def test_non_finite_numbers_reject_the_whole_submission(self):
+        url = reverse("dashboard:add_job_entry", args=[self.project.pk])
+        for value in ("NaN", "Infinity", "-inf", "sNaN"):
+            with self.subTest(value=value):
+                response = self.client.post(
+                    url,
+                    {
+                        "date": "2024-01-02",
+                        "hours[]": [value],
+                        "asset[]": [str(self.asset.pk)],
+                        "employee[]": [""],
+                        "description[]": ["Digging"],
+                        "material_description[]": ["Gravel"],
+                        "material_quantity[]": ["1"],
+                        "material_unit[]": [""],
+                        "material_cost[]": [value],
+                    },
+                )
+                self.assertRedirects(response, url)
+        self.assertFalse(JobEntry.objects.filter(project=self.project).exists())
+
+    def test_rows_cannot_reference_another_contractors_asset(self):
+        other = Contractor.objects.create(name="Other", email="other@example.com")
+        foreign_asset = other.assets.create(
+            name="Crane", cost_rate=Decimal("50"), billable_rate=Decimal("90")
+        )
+        url = reverse("dashboard:add_job_entry", args=[self.project.pk])
+        self.client.post(
+            url,
+            {
+                "date": "2024-01-02",
+                "hours[]": ["2"],
+                "asset[]": [str(foreign_asset.pk)],
+                "employee[]": [""],
+                "description[]": ["Lifting"],
+            },
+        )
+
+        entry = JobEntry.objects.get(project=self.project)
+        self.assertIsNone(entry.asset)
+        self.assertEqual(entry.billable_amount, Decimal("0"))
+
+    def test_edit_job_entry_recomputes_amounts(self):
+        entry = JobEntry.objects.create(
+            project=self.project, date="2024-01-02", hours=Decimal("1"), asset=self.asset
+        )
+        url = reverse("dashboard:edit_job_entry", args=[entry.pk])
+        data = {"date": "2024-01-02", "hours": "3", "asset": str(self.asset.pk)}
+
+        # session, user with its contractor, entry with its project and contractor,
+        # asset, then the UPDATE and the project touch.
+        with self.assertNumQueries(6):
+            response = self.client.post(url, data)
+
+        self.assertRedirects(
+            response, reverse("dashboard:project_detail", args=[self.project.pk])
+        )
+        entry.refresh_from_db()
+        self.assertEqual(entry.billable_amount, Decimal("60.00"))
+
+
+class SearchEntriesTests(TestCase):
+    def setUp(self):
+        self.contractor = Contractor.objects.create(
+            name="Test Contractor", email="user@example.com"
+        )
+        ContractorUser.objects.create_user(
+            email="user@example.com", password="secret", contractor=self.contractor
+        )
+        self.client.post(
+            reverse("login"), {"username": "user@example.com", "password": "secret"}
+        )
+
+    def test_results_include_project_names_without_extra_queries(self):
+        for name in ("North", "South", "East"):
+            project = self.contractor.projects.create(name=name, start_date="2024-01-01")
+            JobEntry.objects.create(
+                project=project,
+                date="2024-01-02",
+                hours=Decimal("1"),
+                material_description="Gravel",
+                material_cost=Decimal("10"),
+                description="Gravel delivery",
+            )
+
+        # session, user with its contractor, then a single query for the entries
+        with self.assertNumQueries(3):
+            response = self.client.get(reverse("dashboard:search_entries"), {"q": "gravel"})
+
+        projects = sorted(r["project"] for r in response.json()["results"])
+        self.assertEqual(projects, ["East", "North", "South"])
+
+    def test_results_match_asset_and_employee_names(self):
+        project = self.contractor.projects.create(name="North", start_date="2024-01-01")
+        asset = self.contractor.assets.create(
+            name="Bulldozer", cost_rate=Decimal("10"), billable_rate=Decimal("20")
+        )
+        employee = self.contractor.employees.create(
+            name="Dozer Dan", cost_rate=Decimal("15"), billable_rate=Decimal("30")
+        )
+        by_asset = JobEntry.objects.create(
+            project=project, date="2024-01-02", hours=Decimal("1"), asset=asset
+        )
+        by_employee = JobEntry.objects.create(
+            project=project, date="2024-01-03", hours=Decimal("1"), employee=employee
+        )
+        JobEntry.objects.create(
+            project=project, date="2024-01-04", hours=Decimal("1"), description="Grading"
+        )
+
+        response = self.client.get(reverse("dashboard:search_entries"), {"q": "dozer"})
+
+        ids = sorted(r["id"] for r in response.json()["results"])
+        self.assertEqual(ids, [by_asset.pk, by_employee.pk])
+
+    def test_amounts_keep_two_decimal_places(self):
+        project = self.contractor.projects.create(name="North", start_date="2024-01-01")
+        asset = self.contractor.assets.create(
+            name="Bulldozer", cost_rate=Decimal("10"), billable_rate=Decimal("25")
+        )
+        JobEntry.objects.create(
+            project=project, date="2024-01-02", hours=Decimal("1.5"), asset=asset
+        )
+
+        response = self.client.get(reverse("dashboard:search_entries"), {"q": "dozer"})
+
+        self.assertEqual(response.json()["results"][0]["amount"], "37.50")
+
+    def test_results_are_the_ten_newest_matches(self):
+        project = self.contractor.projects.create(name="North", start_date="2024-01-01")
+        for day in range(1, 13):
+            JobEntry.objects.create(
+                project=project,
+                date=f"2024-01-{day:02d}",
+                hours=Decimal("1"),
+                description="Trenching",
+            )
+
+        response = self.client.get(reverse("dashboard:search_entries"), {"q": "trench"})
+
+        results = response.json()["results"]
+        self.assertEqual(len(results), 10)
+        self.assertEqual(results[0]["date"], "2024-01-12")
+        self.assertEqual(results[-1]["date"], "2024-01-03")
+        self.assertEqual(results[0]["amount"], "0.00")
+
+    def test_material_templates_support_conditional_requests(self):
+        url = reverse("dashboard:material_templates")
+        response = self.client.get(url)
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(len(response.json()["templates"]), 2)
+        self.assertIn("max-age=86400", response["Cache-Control"])
+
+        response = self.client.get(url, HTTP_IF_NONE_MATCH=response["ETag"])
+        self.assertEqual(response.status_code, 304)
+
+    def test_dump_material_templates_matches_the_api_body(self):
+        with tempfile.TemporaryDirectory() as tmp:
+            output = Path(tmp) / "api" / "material_templates.json"
+            call_command("dump_material_templates", output=str(output), stdout=StringIO())
+            dumped = json.loads(output.read_text())
+
+        response = self.client.get(reverse("dashboard:material_templates"))
+        self.assertEqual(dumped, response.json())
@@ -1,23 +1,57 @@
+import hashlib
+import heapq
+import io
+import json
+import logging
 from decimal import Decimal, InvalidOperation
-from collections import defaultdict
+from functools import lru_cache, partial, reduce
+from itertools import groupby, islice, zip_longest
+from operator import attrgetter, itemgetter, or_
+from pathlib import Path
 from types import SimpleNamespace
+from urllib.parse import unquote, urlsplit
 
 from django.conf import settings
+from django.contrib.staticfiles import finders
 from django.contrib.auth.decorators import login_required
-from django.db.models import Sum, Q
+from django.db import transaction
+from django.db.models import (
+    CharField,
+    Count,
+    Exists,
+    F,
+    Func,
+    Max,
+    OuterRef,
+    Q,
+    Sum,
+    Value,
+)
+from django.db.models.functions import Coalesce
 from django.http import HttpResponse, JsonResponse
 from django.shortcuts import get_object_or_404, redirect, render
 from django.template.loader import get_template
 from django.contrib import messages
+from django.core.cache import cache
+from django.core.serializers.json import DjangoJSONEncoder
 from django.utils import timezone
-from datetime import datetime, timedelta
-from django.core.exceptions import ObjectDoesNotExist
+from django.utils.cache import get_conditional_response, patch_cache_control
+from datetime import MAXYEAR, MINYEAR, datetime, timedelta
+from django.core.exceptions import ObjectDoesNotExist, SuspiciousFileOperation
+from django.core.paginator import Paginator
 from django.db.utils import OperationalError, ProgrammingError
+from django.utils._os import safe_join
 
 try:
-    from weasyprint import HTML
+    from weasyprint import HTML, default_url_fetcher
 except Exception:  # pragma: no cover - optional dependency
     HTML = None
+    default_url_fetcher = None
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover - optional dependency
+    orjson = None
 
 from tracker.models import (
     Asset,
@@ -29,15 +63,159 @@ from tracker.models import (
     EstimateEntry,
 )
 
+logger = logging.getLogger(__name__)
+
+# Reused by the per-row profit/margin loops in the report views instead of
+# parsing a new Decimal for every row.
+ZERO = Decimal("0")
+HUNDRED = Decimal("100")
+
+# Dashboard greeting indexed by local hour: morning until noon, afternoon
+# until 6pm, evening after.
+GREETINGS = ("Good Morning",) * 12 + ("Good Afternoon",) * 6 + ("Good Evening",) * 6
+
+
+# Entry text columns searched by _entry_search_q; also the columns carrying
+# the trigram indexes from migration 0011.
+ENTRY_SEARCH_TEXT_FIELDS = ("description", "material_description")
+
+
+def _entry_search_q(contractor, query):
+    """Match job entries whose text, asset name or employee name contains ``query``.
+
+    Asset and employee names are matched through ``IN`` subqueries on the
+    contractor's own rows rather than joins, so every branch of the OR is a
+    predicate on the entry table itself. On PostgreSQL each branch can then use
+    its own index (the trigram indexes from migration 0011 or the FK index) and
+    the planner combines them instead of scanning the joined rows.
+    """
+    matches = [Q(**{f"{field}__icontains": query}) for field in ENTRY_SEARCH_TEXT_FIELDS]
+    matches.append(Q(asset__in=contractor.assets.filter(name__icontains=query).values("pk")))
+    matches.append(
+        Q(employee__in=contractor.employees.filter(name__icontains=query).values("pk"))
+    )
+    return reduce(or_, matches)
+
+
+def _posted_rows(data, *fields):
+    """Return the rows of a repeated form group as tuples, one value per field.
+
+    Each field is read from ``name[]``, falling back to a plain ``name``. Short
+    columns are padded with ``""`` rather than truncated, so a row whose
+    trailing inputs weren't posted is still seen instead of silently dropped.
+    """
+    columns = [data.getlist(f"{field}[]") or data.getlist(field) for field in fields]
+    return list(zip_longest(*columns, fillvalue=""))
+
+
+def _by_pk(queryset, ids):
+    """Return ``{str(pk): obj}`` for the posted ``ids``, fetched in one query.
+
+    Only the referenced rows are loaded, and no query runs when none are
+    posted; blank or malformed ids are simply absent from the result.
+    """
+    pks = {pk for pk in ids if pk.isdigit()}
+    if not pks:
+        return {}
+    return {str(obj.pk): obj for obj in queryset.filter(pk__in=pks)}
+
 
-def safe_decimal(value, default=Decimal("0")):
+def _projects_version(projects):
+    """Return a cache key fragment that changes whenever ``projects`` change.
+
+    ``Project.updated_at`` is bumped when a project's entries or payments
+    change, and the count catches deleted projects.
+    """
+    stamp = projects.order_by().aggregate(updated=Max("updated_at"), count=Count("pk"))
+    updated = stamp["updated"].timestamp() if stamp["updated"] else 0
+    return f"{stamp['count']}:{updated}"
+
+
+def safe_decimal(value, default=ZERO):
     """Return a Decimal, falling back to default on invalid input."""
+    # Model fields already hold Decimals; skip the constructor (and the
+    # exception path for None) for them.
+    if isinstance(value, Decimal):
+        return value
+    if value is None:
+        return default
     try:
         return Decimal(value)
     except (TypeError, InvalidOperation, ValueError):
         return default
 
 
+def _posted_decimal(value):
+    """Parse a posted number; None unless it is a finite Decimal.
+
+    ``Decimal`` accepts "NaN" and "Infinity", which would only fail later when
+    compared or saved, so they are rejected along with unparsable text.
+    """
+    number = safe_decimal(value or 0, None)
+    if number is None or not number.is_finite():
+        return None
+    return number
+
+
+class MoneyText(Func):
+    """Render a two-place decimal column as text inside the query.
+
+    Postgres keeps the column's scale when casting numeric to varchar; SQLite
+    stores decimals as plain numbers, so it formats them with printf instead.
+    """
+
+    function = "CAST"
+    template = "%(function)s(%(expressions)s AS varchar)"
+    output_field = CharField()
+
+    def as_sqlite(self, compiler, connection, **extra_context):
+        # Doubled twice: once for this template, once for the backend's
+        # %s-to-? parameter conversion.
+        return self.as_sql(
+            compiler,
+            connection,
+            template="printf('%%%%.2f', %(expressions)s)",
+            **extra_context,
+        )
+
+
+def _week_starts(start, today):
+    """Return the start of each 7-day week from ``start`` up to ``today``.
+
+    Weeks are anchored at the project start rather than calendar weeks, so an
+    entry's bucket is simply ``(date - start).days // 7``.
+    """
+    if start > today:
+        return []
+    return [start + timedelta(weeks=i) for i in range((today - start).days // 7 + 1)]
+
+
+def _percent(part, whole):
+    """Return ``part`` as a float percentage of ``whole``, or 0 when empty."""
+    return float(part / whole * 100) if whole > 0 else 0
+
+
+def _cost_split(cost, billable):
+    """Return the (cost, profit) percentages of ``billable`` for a progress bar."""
+    if billable > 0:
+        cost_percent = _percent(cost, billable)
+        return cost_percent, 100 - cost_percent
+    return 0, 0
+
+
+def _json_response(payload):
+    """Serialize ``payload`` with orjson when installed, else the stdlib encoder.
+
+    Dates come out as ISO strings and Decimals as strings either way, matching
+    what ``JsonResponse`` produced.
+    """
+    if orjson is not None:
+        body = orjson.dumps(payload, default=str)
+    else:
+        body = json.dumps(payload, cls=DjangoJSONEncoder)
+    return HttpResponse(body, content_type="application/json")
+
+
 def get_contractor(user):
     """Safely return the contractor associated with the given user."""
     try:
@@ -63,12 +241,80 @@ def require_contractor(request):
     return contractor, None
 
 
-# Update this function in your dashboard/views.py file
-def _render_pdf(template_src, context, filename, request=None):
+@lru_cache(maxsize=512)
+def _find_static(path):
+    """Resolve a static asset path to a file on disk, caching the lookup."""
+    return finders.find(path)
+
+
+def _local_asset_path(path):
+    """Map a site-relative static or media URL path to a local file."""
+    if path.startswith(settings.STATIC_URL):
+        return _find_static(path[len(settings.STATIC_URL):])
+    if path.startswith(settings.MEDIA_URL):
+        try:
+            local = safe_join(settings.MEDIA_ROOT, path[len(settings.MEDIA_URL):])
+        except SuspiciousFileOperation:
+            return None
+        return local if Path(local).is_file() else None
+    return None
+
+
+def _pdf_url_fetcher(url, base_url="", **kwargs):
+    """Load our own static/media assets from disk while rendering PDFs.
+
+    WeasyPrint would otherwise fetch stylesheets and images referenced by the
+    report templates over HTTP from this same server for every PDF.
+    """
+    if base_url and url.startswith(base_url):
+        local = _local_asset_path(unquote(urlsplit(url).path))
+        if local:
+            return default_url_fetcher(Path(local).as_uri(), **kwargs)
+    return default_url_fetcher(url, **kwargs)
+
+
+PDF_CACHE_TIMEOUT = 60 * 60
+
+
+@lru_cache(maxsize=16)
+def _get_pdf_template(template_src):
+    """Return the compiled template for a PDF export, reused across requests."""
+    return get_template(template_src)
+
+
+# WeasyPrint makes thousands of small writes; they reach the response in
+# blocks of this size instead of one response chunk each.
+PDF_WRITE_BUFFER_SIZE = 64 * 1024
+
+
+class _ResponseWriter(io.RawIOBase):
+    """Raw file interface over an HttpResponse, so it can sit under a BufferedWriter."""
+
+    def __init__(self, response):
+        self._response = response
+
+    def writable(self):
+        return True
+
+    def write(self, data):
+        self._response.write(bytes(data))
+        return len(data)
+
+
+def _pdf_response(filename):
+    response = HttpResponse(content_type="application/pdf")
+    response["Content-Disposition"] = f"attachment; filename={filename}"
+    return response
+
+
+def _render_pdf(template_src, context, filename, request=None, cache_key=None):
     """Render PDF with proper base_url for images.
 
     Returns None instead of an error response when PDF generation isn't available
     so callers can gracefully fall back to the HTML view without throwing a 500.
+
+    When ``cache_key`` is given the rendered document is cached under it, so a
+    repeat export skips WeasyPrint entirely until the key changes.
     """
     if HTML is None:
         if request:
@@ -78,8 +324,25 @@ def _render_pdf(template_src, context, filename, request=None):
             )
         return None
 
-    template = get_template(template_src)
-    html = template.render(context)
+    if cache_key is not None:
+        pdf = cache.get(cache_key)
+        if pdf is not None:
+            response = _pdf_response(filename)
+            response.content = pdf
+            return response
+
+    try:
+        html = _get_pdf_template(template_src).render(context)
+    except Exception:
+        # A broken or missing report template shouldn't turn the export into
+        # a 500; the caller still renders its HTML view.
+        logger.exception("PDF template %s failed to render", template_src)
+        if request:
+            messages.error(
+                request,
+                "PDF generation failed. Showing the HTML view instead.",
+            )
+        return None
 
     try:
         # Use request.build_absolute_uri() for proper image loading
@@ -88,13 +351,21 @@ def _render_pdf(template_src, context, filename, request=None):
         else:
             base_url = str(settings.BASE_DIR)
 
-        pdf = HTML(
-            string=html,
-            base_url=base_url,
-            encoding='utf-8'
-        ).write_pdf()
-    except Exception as e:
-        print(f"PDF Generation Error: {e}")  # For debugging
+        # Write straight into the response rather than building the whole
+        # document as bytes and copying it into an HttpResponse afterwards.
+        # The buffer coalesces WeasyPrint's small writes into large chunks.
+        response = _pdf_response(filename)
+        with io.BufferedWriter(
+            _ResponseWriter(response), buffer_size=PDF_WRITE_BUFFER_SIZE
+        ) as target:
+            HTML(
+                string=html,
+                base_url=base_url,
+                encoding='utf-8',
+                url_fetcher=partial(_pdf_url_fetcher, base_url=base_url),
+            ).write_pdf(target=target)
+    except Exception:
+        logger.exception("PDF generation failed for %s", filename)
         if request:
             messages.error(
                 request,
@@ -102,88 +373,124 @@ def _render_pdf(template_src, context, filename, request=None):
             )
         return None
 
-    start = pdf.find(b"%PDF")
-    if start == -1:
-        if request:
-            messages.error(
-                request,
-                "PDF generation failed. Showing the HTML view instead.",
-            )
-        return None
-    
-    response = HttpResponse(pdf[start:], content_type="application/pdf")
-    response["Content-Disposition"] = f"attachment; filename={filename}"
+    if cache_key is not None:
+        # Only a cached export pays for joining the chunks into one bytes value.
+        cache.set(cache_key, response.content, PDF_CACHE_TIMEOUT)
     return response
 
 
+# Columns the customer/contractor job reports actually render for each entry.
+# ``project`` is kept because the related manager assigns it to each row and
+# would otherwise fetch the deferred column once per entry.
+REPORT_ENTRY_FIELDS = (
+    "project",
+    "date",
+    "hours",
+    "description",
+    "material_description",
+    "billable_amount",
+    "cost_amount",
+    "asset__name",
+    "employee__name",
+)
 
-@login_required
-def contractor_summary(request):
-    contractor, missing_response = require_contractor(request)
-    if missing_response:
-        return missing_response
+# Columns the customer estimate/invoice template prints for each line item.
+LINE_ITEM_FIELDS = ("description", "material_description", "billable_amount")
+
+INTERNAL_ESTIMATE_ENTRY_FIELDS = (
+    "estimate",
+    "date",
+    "hours",
+    "description",
+    "material_description",
+    "material_cost",
+    "billable_amount",
+    "cost_amount",
+    "asset__name",
+    "asset__cost_rate",
+    "asset__billable_rate",
+    "employee__name",
+    "employee__cost_rate",
+    "employee__billable_rate",
+)
 
-    projects = contractor.projects.filter(
-        end_date__isnull=True
-    ).prefetch_related("job_entries", "payments")
-    for p in projects:
-        p.total_billable = sum((je.billable_amount or 0) for je in p.job_entries.all())
-        p.total_payments = sum((pay.amount or 0) for pay in p.payments.all())
-        p.outstanding = p.total_billable - p.total_payments
-    first_project = projects.first()
-
-    overall_billable = (
-        JobEntry.objects.filter(
-            project__contractor=contractor, project__end_date__isnull=True
-        )
-        .aggregate(total=Sum("billable_amount"))
-        .get("total")
-        or 0
-    )
-    overall_payments = (
-        Payment.objects.filter(
-            project__contractor=contractor, project__end_date__isnull=True
-        )
-        .aggregate(total=Sum("amount"))
-        .get("total")
-        or 0
+
+def _contractor_summary_data(contractor):
+    # The active projects are rendered anyway, so the overall totals are summed
+    # from their annotations instead of two more aggregate round trips.
+    # Only the columns the dashboard renders are loaded, which also keeps the
+    # cached copy of these rows small.
+    projects = list(
+        contractor.projects.active_with_totals()
+        .only("contractor", "name", "start_date")
+        .order_by("pk")
     )
-    outstanding = overall_billable - overall_payments
 
-    # Recent activity for dashboard
-    recent_entries = (
+    # Recent activity for dashboard. The sidebar only prints these columns, so
+    # plain dicts are fetched instead of entries with three joined models.
+    recent_entries = list(
         JobEntry.objects.filter(project__contractor=contractor)
-        .select_related("project", "asset", "employee")
-        .order_by("-date")[:5]
+        .order_by("-date")
+        .values(
+            "date",
+            "description",
+            "billable_amount",
+            "project__name",
+            "asset__name",
+            "employee__name",
+        )[:5]
     )
 
-    recent_payments = (
+    recent_payments = list(
         Payment.objects.filter(project__contractor=contractor)
-        .select_related("project")
-        .order_by("-date")[:5]
+        .order_by("-date")
+        .values("date", "notes", "amount", "project__name")[:5]
     )
 
-    current_hour = timezone.localtime().hour
-    if current_hour < 12:
-        greeting = "Good Morning"
-    elif current_hour < 18:
-        greeting = "Good Afternoon"
-    else:
-        greeting = "Good Evening"
+    return {
+        "projects": projects,
+        "overall_billable": sum((p.total_billable for p in projects), ZERO),
+        "overall_payments": sum((p.total_payments for p in projects), ZERO),
+        "recent_entries": recent_entries,
+        "recent_payments": recent_payments,
+    }
+
+
+@login_required
+def contractor_summary(request):
+    contractor, missing_response = require_contractor(request)
+    if missing_response:
+        return missing_response
+
+    # Everything below the greeting only changes with the contractor's projects,
+    # entries or payments, so it is cached against the projects' version.
+    cache_key = "contractor_summary:{}:{}".format(
+        contractor.pk, _projects_version(contractor.projects.all())
+    )
+    data = cache.get(cache_key)
+    if data is None:
+        data = _contractor_summary_data(contractor)
+        cache.set(cache_key, data, 5 * 60)
+    projects = data["projects"]
+    overall_billable = data["overall_billable"]
+    overall_payments = data["overall_payments"]
+    outstanding = overall_billable - overall_payments
+
+    greeting = GREETINGS[timezone.localtime().hour]
 
     return render(
         request,
         "dashboard/contractor_summary.html",
         {
             "projects": projects,
-            "first_project": first_project,
+            "first_project": projects[0] if projects else None,
             "overall_billable": overall_billable,
             "overall_payments": overall_payments,
             "outstanding": outstanding,
             "contractor": contractor,
             "contractor_logo_url": contractor.logo.url if contractor.logo else None,
-            "recent_entries": recent_entries,
-            "recent_payments": recent_payments,
+            "recent_entries": data["recent_entries"],
+            "recent_payments": data["recent_payments"],
             "greeting": greeting,
         },
     )
@@ -196,7 +503,7 @@ def project_list(request):
         return missing_response
     if request.method == "POST":
         name = request.POST.get("name")
-        start_date = request.POST.get("start_date") or timezone.now().date()
+        start_date = request.POST.get("start_date") or timezone.localdate()
         if name:
             Project.objects.create(
                 contractor=contractor, name=name, start_date=start_date
@@ -206,29 +513,26 @@ def project_list(request):
 
     # Search functionality
     search_query = request.GET.get("search", "")
-    projects = contractor.projects.filter(
-        end_date__isnull=True
-    ).prefetch_related("job_entries", "payments")
+    projects = contractor.projects.active()
 
     if search_query:
+        # Match entry descriptions with an EXISTS subquery so the search
+        # doesn't join every job entry and then DISTINCT the projects.
+        entry_matches = JobEntry.objects.filter(
+            project=OuterRef("pk"), description__icontains=search_query
+        )
         projects = projects.filter(
-            Q(name__icontains=search_query)
-            | Q(job_entries__description__icontains=search_query)
-        ).distinct()
-
-    total_billable = Decimal("0")
-    total_payments = Decimal("0")
+            Q(name__icontains=search_query) | Exists(entry_matches)
+        )
 
-    for p in projects:
-        p.total_billable = sum((je.billable_amount or 0) for je in p.job_entries.all())
-        p.total_payments = sum((pay.amount or 0) for pay in p.payments.all())
-        p.outstanding = p.total_billable - p.total_payments
-        total_billable += Decimal(p.total_billable)
-        total_payments += Decimal(p.total_payments)
+    # Only the columns the cards show; the totals come from the annotations.
+    projects = projects.with_totals().only("contractor", "name", "start_date")
+    total_billable = sum((p.total_billable for p in projects), ZERO)
+    total_payments = sum((p.total_payments for p in projects), ZERO)
 
     total_outstanding = total_billable - total_payments
 
-    today = timezone.now().date()
+    today = timezone.localdate()
 
     return render(
         request,
@@ -255,84 +559,51 @@ def estimate_list(request):
         estimate = contractor.estimates.create(name=name)
         return redirect("dashboard:add_estimate_entry", pk=estimate.pk)
 
-    try:
-        print("=== ESTIMATE LIST DEBUG ===")
-        
-        estimates = contractor.estimates.all().prefetch_related("entries")
-        print(f"Found {estimates.count()} estimates")
-        
-        # Calculate totals and summary statistics
-        total_value = Decimal("0")
-        total_profit = Decimal("0")
-        accepted_count = 0
-        
-        today = timezone.now().date()
-        week_from_now = today + timedelta(days=7)
-        
-        estimates_list = []
-        
-        for est in estimates:
-            try:
-                print(f"Processing estimate: {est.id} - {est.name}")
-                
-                # Use the model's @property methods directly - don't try to override them
-                calculated_billable = est.total_billable  # This calls the @property method
-                calculated_cost = est.total_cost          # This calls the @property method
-                calculated_profit = est.total_profit      # This calls the @property method
-                calculated_margin = est.profit_margin     # This calls the @property method
-                
-                print(f"  Calculated totals: Billable=${calculated_billable}, Cost=${calculated_cost}")
-                
-                # Add calculated values as new attributes (not overriding properties)
-                est.display_total_billable = calculated_billable
-                est.display_total_cost = calculated_cost
-                est.display_total_profit = calculated_profit
-                est.display_profit_margin = calculated_margin
-                
-                # Add to summary totals
-                total_value += calculated_billable
-                total_profit += calculated_profit
-                
-                # Check status
-                if getattr(est, 'status', 'draft') == 'accepted':
-                    accepted_count += 1
-                
-                estimates_list.append(est)
-                    
-            except Exception as e:
-                print(f"Error processing estimate {est.id}: {e}")
-                import traceback
-                traceback.print_exc()
-                
-                # Add with safe defaults
-                est.display_total_billable = Decimal("0")
-                est.display_total_cost = Decimal("0") 
-                est.display_total_profit = Decimal("0")
-                est.display_profit_margin = Decimal("0")
-                estimates_list.append(est)
-                continue
+    # Per-estimate totals come from one GROUP BY over the entries instead
+    # of summing each estimate's prefetched entries through its properties.
+    zero = Value(ZERO)
+    estimates = contractor.estimates.annotate(
+        display_total_billable=Coalesce(Sum("entries__billable_amount"), zero),
+        display_total_cost=Coalesce(Sum("entries__cost_amount"), zero),
+    ).annotate(
+        display_total_profit=F("display_total_billable") - F("display_total_cost")
+    )
 
-        print(f"Summary totals: Value=${total_value}, Profit=${total_profit}, Accepted={accepted_count}")
+    # Calculate totals and summary statistics
+    total_value = ZERO
+    total_profit = ZERO
+    accepted_count = 0
 
-        return render(request, "dashboard/estimate_list.html", {
-            "estimates": estimates_list,
-            "total_value": total_value,
-            "total_profit": total_profit,
-            "accepted_count": accepted_count,
-            "today": today,
-            "week_from_now": week_from_now,
-        })
-        
-    except Exception as e:
-        print(f"CRITICAL ERROR in estimate_list: {e}")
-        import traceback
-        traceback.print_exc()
-        
-        return HttpResponse(f"""
-        <h1>Critical Error in estimate_list</h1>
-        <p>Error: {e}</p>
-        <pre>{traceback.format_exc()}</pre>
-        """)
+    today = timezone.localdate()
+    week_from_now = today + timedelta(days=7)
+
+    estimates_list = list(estimates)
+    for est in estimates_list:
+        billable = est.display_total_billable
+        est.display_profit_margin = (
+            est.display_total_profit / billable * HUNDRED if billable else ZERO
+        )
+
+        total_value += billable
+        total_profit += est.display_total_profit
+        if est.status == "accepted":
+            accepted_count += 1
+
+    logger.debug(
+        "Estimate list totals: value=%s profit=%s accepted=%s",
+        total_value,
+        total_profit,
+        accepted_count,
+    )
+
+    return render(request, "dashboard/estimate_list.html", {
+        "estimates": estimates_list,
+        "total_value": total_value,
+        "total_profit": total_profit,
+        "accepted_count": accepted_count,
+        "today": today,
+        "week_from_now": week_from_now,
+    })
 
 
 @login_required
@@ -342,39 +613,48 @@ def accept_estimate(request, pk):
     if missing_response:
         return missing_response
     
-    estimate = get_object_or_404(Estimate, pk=pk, contractor=contractor)
+    estimate = get_object_or_404(contractor.estimates, pk=pk)
     
     if request.method == "POST":
         try:
-            # Create a new project from the estimate
-            project = Project.objects.create(
-                contractor=contractor,
-                name=estimate.name,
-                start_date=estimate.created_date,
-                estimate=estimate,
-            )
-            
-            # Convert all estimate entries to job entries
-            for estimate_entry in estimate.entries.all():
-                JobEntry.objects.create(
-                    project=project,
-                    date=estimate_entry.date,
-                    hours=estimate_entry.hours,
-                    asset=estimate_entry.asset,
-                    employee=estimate_entry.employee,
-                    material_description=estimate_entry.material_description,
-                    material_cost=estimate_entry.material_cost,
-                    service_markup=estimate_entry.service_markup,
-                    description=estimate_entry.description,
+            with transaction.atomic():
+                # Create a new project from the estimate
+                project = Project.objects.create(
+                    contractor=contractor,
+                    name=estimate.name,
+                    start_date=estimate.created_date,
+                    estimate=estimate,
                 )
-            
-            # Update estimate status
-            estimate.status = 'accepted'
-            estimate.save()
 
-            # Remove the estimate record once it's converted
-            estimate.delete()
-            
+                # Convert all estimate entries to job entries. bulk_create
+                # skips save(), so the amounts are computed up front.
+                job_entries = [
+                    JobEntry(
+                        project=project,
+                        date=estimate_entry.date,
+                        hours=estimate_entry.hours,
+                        asset=estimate_entry.asset,
+                        employee=estimate_entry.employee,
+                        material_description=estimate_entry.material_description,
+                        material_cost=estimate_entry.material_cost,
+                        service_markup=estimate_entry.service_markup,
+                        description=estimate_entry.description,
+                    )
+                    for estimate_entry in estimate.entries.select_related(
+                        "asset", "employee"
+                    )
+                ]
+                for entry in job_entries:
+                    entry.calculate_amounts()
+                JobEntry.objects.bulk_create(job_entries, batch_size=200)
+
+                # Update estimate status
+                estimate.status = 'accepted'
+                estimate.save()
+
+                # Remove the estimate record once it's converted
+                estimate.delete()
+
             messages.success(
                 request, 
                 f"Estimate '{estimate.name}' has been accepted and converted to project '{project.name}'."
@@ -394,7 +674,7 @@ def delete_estimate(request, pk):
     contractor, missing_response = require_contractor(request)
     if missing_response:
         return missing_response
-    estimate = get_object_or_404(Estimate, pk=pk, contractor=contractor)
+    estimate = get_object_or_404(contractor.estimates, pk=pk)
     if request.method == "POST":
         estimate.delete()
         messages.success(request, "Estimate deleted.")
@@ -407,7 +687,7 @@ def delete_project(request, pk):
     contractor, missing_response = require_contractor(request)
     if missing_response:
         return missing_response
-    project = get_object_or_404(Project, pk=pk, contractor=contractor)
+    project = get_object_or_404(contractor.projects, pk=pk)
     if request.method == "POST":
         project.delete()
         messages.success(request, "Project deleted.")
@@ -422,14 +702,10 @@ def reports(request):
     if missing_response:
         return missing_response
 
-    projects = contractor.projects.filter(
-        end_date__isnull=True
-    ).prefetch_related("job_entries", "payments")
-
-    for p in projects:
-        p.total_billable = sum((je.billable_amount or 0) for je in p.job_entries.all())
-        p.total_payments = sum((pay.amount or 0) for pay in p.payments.all())
-        p.outstanding = p.total_billable - p.total_payments
+    # The reports page only lists names and links, so no totals are needed.
+    projects = contractor.projects.active().only(
+        "contractor", "name"
+    )
 
     return render(
         request,
@@ -449,15 +725,33 @@ def project_detail(request, pk):
     if missing_response:
         return missing_response
 
-    project = get_object_or_404(Project, pk=pk, contractor=contractor)
+    project = get_object_or_404(contractor.projects, pk=pk)
 
     # Get filter parameters
     entry_filter = request.GET.get("filter", "all")
     search_query = request.GET.get("search", "")
 
-    # Base queryset for job entries
-    job_entries = project.job_entries.select_related("asset", "employee").order_by(
-        "-date"
+    # Base queryset for job entries. The page needs every filtered row for the
+    # listing and timeline, so the analytics are folded into the same pass
+    # below; only the columns that pass and the template read are selected.
+    job_entries = (
+        project.job_entries.select_related("asset", "employee")
+        .only(
+            "project",
+            "date",
+            "hours",
+            "description",
+            "material_description",
+            "material_cost",
+            "billable_amount",
+            "asset__name",
+            "asset__cost_rate",
+            "asset__billable_rate",
+            "employee__name",
+            "employee__cost_rate",
+            "employee__billable_rate",
+        )
+        .order_by("-date")
     )
 
     # Apply filters
@@ -470,15 +764,12 @@ def project_detail(request, pk):
 
     # Apply search
     if search_query:
-        job_entries = job_entries.filter(
-            Q(description__icontains=search_query)
-            | Q(material_description__icontains=search_query)
-            | Q(asset__name__icontains=search_query)
-            | Q(employee__name__icontains=search_query)
-        )
+        job_entries = job_entries.filter(_entry_search_q(contractor, search_query))
 
     job_entries_qs = job_entries
-    payments = list(project.payments.all().order_by("-date"))
+    # Not LIMITed: the timeline shows every payment day and the total is summed
+    # from these rows, so one full fetch replaces a slice plus an aggregate.
+    payments = list(project.payments.order_by("-date"))
 
     # Convert queryset to list for repeated iteration, guarding against bad data
     try:
@@ -486,71 +777,120 @@ def project_detail(request, pk):
     except Exception:
         job_entries = []
 
-    # Build timeline combining job entries and payments
-    entries_by_date = defaultdict(list)
-    for je in job_entries:
-        if getattr(je, "date", None):
-            entries_by_date[je.date].append(je)
-
-    payments_by_date = defaultdict(list)
-    for payment in payments:
-        if getattr(payment, "date", None):
-            payments_by_date[payment.date].append(payment)
-
-    timeline_items = []
-    for dt in sorted(set(entries_by_date) | set(payments_by_date), reverse=True):
-        if dt in entries_by_date:
-            timeline_items.append({"date": dt, "entries": entries_by_date[dt]})
-        if dt in payments_by_date:
-            timeline_items.append({"date": dt, "payments": payments_by_date[dt]})
-
-    # Calculate totals
-    total_billable = sum(((je.billable_amount or Decimal("0")) for je in job_entries), Decimal("0"))
-    total_payments = sum(((p.amount or Decimal("0")) for p in payments), Decimal("0"))
-    outstanding = total_billable - total_payments
-    collection_rate = float(total_payments / total_billable * 100) if total_billable else 0
-
-    # Enhanced cost and billable breakdowns for analytics
-    labor_cost = equipment_cost = material_cost = Decimal("0")
-    billable_labor = billable_equipment = billable_material = Decimal("0")
+    # Build timeline combining job entries and payments. Both lists are
+    # already ordered newest first, so group each by date and merge the two
+    # streams rather than unioning the dates and sorting them again.
+    entry_days = (
+        {"date": dt, "entries": list(group)}
+        for dt, group in groupby(job_entries, key=attrgetter("date"))
+    )
+    payment_days = (
+        {"date": dt, "payments": list(group)}
+        for dt, group in groupby(payments, key=attrgetter("date"))
+    )
+    timeline_items = list(
+        heapq.merge(entry_days, payment_days, key=itemgetter("date"), reverse=True)
+    )
 
     # Get contractor's material margin
     raw_margin = getattr(project.contractor, "material_margin", 0)
     contractor_margin = safe_decimal(raw_margin)
-    material_margin = contractor_margin / Decimal("100") if contractor_margin else Decimal("0")
+    material_margin = contractor_margin / HUNDRED if contractor_margin else ZERO
     margin_multiplier = Decimal("1") - material_margin
 
+    # Weeks for the trend chart, anchored at the project start date.
+    current_date = timezone.localdate()
+    week_starts = _week_starts(project.start_date, current_date)
+    num_weeks = len(week_starts)
+
+    # The billable total comes straight from the stored amounts, so it
+    # stays correct even if the breakdown pass below fails.
+    total_billable = sum((je.billable_amount for je in job_entries), ZERO)
+
+    # Cost/billable breakdowns, weekly buckets and hours are all accumulated
+    # in a single pass over the entries.
+    labor_cost = equipment_cost = material_cost = ZERO
+    billable_labor = billable_equipment = billable_material = ZERO
+    week_hours = [ZERO] * num_weeks
+    week_billable = [ZERO] * num_weeks
+    week_cost = [ZERO] * num_weeks
+    # total_hours counts labor hours when the project has any employee
+    # entries, otherwise equipment hours; both are tracked until we know.
+    employee_hours = asset_hours = ZERO
+    has_employee_entries = False
+    # Entries arrive newest first, so runs share a date; the week index is
+    # only recomputed when the date changes.
+    project_start = project.start_date
+    bucket_date = None
+    index = -1
+
+    # Every column read here is a non-null Decimal (material_cost aside), so
+    # the loop uses plain attribute reads rather than per-row conversions; it
+    # runs over the rows the listing already needs, so it costs no query.
     try:
         for je in job_entries:
-            hours = safe_decimal(getattr(je, "hours", 0))
-            
+            billable = je.billable_amount
+            hours = je.hours
+            is_material = bool(je.material_description)
+            entry_cost = ZERO
+
             # Labor calculations
-            if je.employee:
-                emp_cost_rate = safe_decimal(getattr(je.employee, "cost_rate", 0))
-                emp_billable_rate = safe_decimal(getattr(je.employee, "billable_rate", 0))
-                labor_cost += emp_cost_rate * hours
-                billable_labor += emp_billable_rate * hours
-            
+            employee = je.employee
+            if employee is not None:
+                has_employee_entries = True
+                emp_cost = employee.cost_rate * hours
+                labor_cost += emp_cost
+                billable_labor += employee.billable_rate * hours
+                entry_cost += emp_cost
+                if not is_material:
+                    employee_hours += hours
+
             # Equipment calculations
-            if je.asset:
-                asset_cost_rate = safe_decimal(getattr(je.asset, "cost_rate", 0))
-                asset_billable_rate = safe_decimal(getattr(je.asset, "billable_rate", 0))
-                equipment_cost += asset_cost_rate * hours
-                billable_equipment += asset_billable_rate * hours
-            
+            asset = je.asset
+            if asset is not None:
+                asset_cost = asset.cost_rate * hours
+                equipment_cost += asset_cost
+                billable_equipment += asset.billable_rate * hours
+                entry_cost += asset_cost
+                if not is_material:
+                    asset_hours += hours
+
             # Material calculations
             if je.material_cost:
-                mat_cost = safe_decimal(je.material_cost) * hours
+                mat_cost = je.material_cost * hours
                 material_cost += mat_cost
+                entry_cost += mat_cost
                 if margin_multiplier > 0:
                     billable_material += mat_cost / margin_multiplier
                 else:
                     # If no margin multiplier, use the billable amount directly
-                    billable_material += safe_decimal(getattr(je, "billable_amount", 0))
+                    billable_material += billable
+
+            entry_date = je.date
+            if entry_date != bucket_date:
+                bucket_date = entry_date
+                index = (entry_date - project_start).days // 7
+            if 0 <= index < num_weeks:
+                if not is_material:
+                    week_hours[index] += hours
+                week_billable[index] += billable
+                week_cost[index] += entry_cost
     except Exception:
-        # Fallback to zero values if calculation fails
-        labor_cost = equipment_cost = material_cost = Decimal("0")
-        billable_labor = billable_equipment = billable_material = Decimal("0")
+        # Fallback to zero values if calculation fails. The loop fills every
+        # breakdown at once, so all of them are reset rather than rendering
+        # the partial sums of the rows before the failure.
+        logger.exception("Analytics failed for project %s", project.pk)
+        labor_cost = equipment_cost = material_cost = ZERO
+        billable_labor = billable_equipment = billable_material = ZERO
+        week_hours = [ZERO] * num_weeks
+        week_billable = [ZERO] * num_weeks
+        week_cost = [ZERO] * num_weeks
+        employee_hours = asset_hours = ZERO
+        has_employee_entries = False
+
+    total_payments = sum(((p.amount or ZERO) for p in payments), ZERO)
+    outstanding = total_billable - total_payments
+    collection_rate = float(total_payments / total_billable * 100) if total_billable else 0
 
     # Calculate totals and percentages
     total_cost = labor_cost + equipment_cost + material_cost
@@ -558,20 +898,15 @@ def project_detail(request, pk):
     margin = (profit / total_billable * 100) if total_billable else 0
 
     # Cost breakdown percentages
-    if total_cost > 0:
-        labor_percent = float(labor_cost / total_cost * 100)
-        equipment_percent = float(equipment_cost / total_cost * 100)
-        material_percent = float(material_cost / total_cost * 100)
-    else:
-        labor_percent = equipment_percent = material_percent = 0
+    labor_percent, equipment_percent, material_percent = (
+        _percent(part, total_cost) for part in (labor_cost, equipment_cost, material_cost)
+    )
 
     # Billable breakdown percentages
-    if total_billable > 0:
-        billable_labor_percent = float(billable_labor / total_billable * 100)
-        billable_equipment_percent = float(billable_equipment / total_billable * 100)
-        billable_material_percent = float(billable_material / total_billable * 100)
-    else:
-        billable_labor_percent = billable_equipment_percent = billable_material_percent = 0
+    billable_labor_percent, billable_equipment_percent, billable_material_percent = (
+        _percent(part, total_billable)
+        for part in (billable_labor, billable_equipment, billable_material)
+    )
 
     # Profit metrics for each category
     labor_profit = billable_labor - labor_cost
@@ -579,73 +914,25 @@ def project_detail(request, pk):
     material_profit = billable_material - material_cost
 
     # Cost vs revenue percentages for progress bars
-    if billable_labor > 0:
-        labor_cost_percent = float(labor_cost / billable_labor * 100)
-        labor_profit_percent = 100 - labor_cost_percent
-    else:
-        labor_cost_percent = labor_profit_percent = 0
-
-    if billable_equipment > 0:
-        equip_cost_percent = float(equipment_cost / billable_equipment * 100)
-        equip_profit_percent = 100 - equip_cost_percent
-    else:
-        equip_cost_percent = equip_profit_percent = 0
-
-    if billable_material > 0:
-        mat_cost_percent = float(material_cost / billable_material * 100)
-        mat_profit_percent = 100 - mat_cost_percent
-    else:
-        mat_cost_percent = mat_profit_percent = 0
-
-    # Weekly breakdown for trends - Enhanced for analytics
-    weekly_data = []
-    current_date = timezone.now().date()
-    start_date = project.start_date
-
-    while start_date <= current_date:
-        end_date = start_date + timedelta(days=6)
-
-        # Filter entries for this week
-        week_entries = [
-            je for je in job_entries
-            if hasattr(je, "date") and je.date and start_date <= je.date <= end_date
-        ]
-
-        # Calculate totals for the week
-        week_hours = sum(
-            (
-                safe_decimal(getattr(je, "hours", 0))
-                for je in week_entries
-                if not getattr(je, "material_description", "")
-            ),
-            Decimal("0"),
-        )
-        week_billable = sum(
-            (safe_decimal(getattr(je, "billable_amount", 0)) for je in week_entries),
-            Decimal("0"),
-        )
-
-        # Calculate week costs more accurately
-        week_cost = Decimal("0")
-        for je in week_entries:
-            hours = safe_decimal(getattr(je, "hours", 0))
-            if je.employee:
-                week_cost += safe_decimal(getattr(je.employee, "cost_rate", 0)) * hours
-            if je.asset:
-                week_cost += safe_decimal(getattr(je.asset, "cost_rate", 0)) * hours
-            if je.material_cost:
-                week_cost += safe_decimal(je.material_cost) * hours
+    labor_cost_percent, labor_profit_percent = _cost_split(labor_cost, billable_labor)
+    equip_cost_percent, equip_profit_percent = _cost_split(
+        equipment_cost, billable_equipment
+    )
+    mat_cost_percent, mat_profit_percent = _cost_split(material_cost, billable_material)
 
-        weekly_data.append(
-            {
-                "week": f"{start_date.strftime('%b %d')}",
-                "hours": float(week_hours),
-                "billable": float(week_billable),
-                "cost": float(week_cost),
-            }
+    # The buckets were filled in the entry pass above (one O(entries) walk, no
+    # per-week rescans); this only formats them.
+    weekly_data = [
+        {
+            "week": week_start.strftime("%b %d"),
+            "hours": float(hours),
+            "billable": float(billable),
+            "cost": float(cost),
+        }
+        for week_start, hours, billable, cost in zip(
+            week_starts, week_hours, week_billable, week_cost
         )
-
-        start_date += timedelta(weeks=1)
+    ]
 
     # Determine maximum value for scaling trend bars
     max_weekly_value = max(
@@ -654,26 +941,8 @@ def project_detail(request, pk):
     ) or 1
 
     # Additional analytics calculations
-    has_employee_entries = any(getattr(je, "employee", None) for je in job_entries)
-    total_hours = sum(
-        (
-            safe_decimal(getattr(je, "hours", 0))
-            for je in job_entries
-            if (
-                (
-                    has_employee_entries
-                    and getattr(je, "employee", None)
-                )
-                or (
-                    not has_employee_entries
-                    and getattr(je, "asset", None)
-                )
-            )
-            and not getattr(je, "material_description", "")
-        ),
-        Decimal("0"),
-    )
-    avg_hourly_rate = (total_billable / total_hours) if total_hours > 0 else Decimal("0")
+    total_hours = employee_hours if has_employee_entries else asset_hours
+    avg_hourly_rate = (total_billable / total_hours) if total_hours > 0 else ZERO
 
     project_duration_weeks = max(1, ((current_date - project.start_date).days // 7) + 1)
     potential_hours = Decimal(project_duration_weeks * 40)
@@ -737,22 +1006,26 @@ def project_detail(request, pk):
         },
     )
 
+def _select_project_choices(contractor):
+    """Active projects with the columns and totals the project picker shows.
+
+    Evaluated once up front so the emptiness check and the template share a
+    single query.
+    """
+    return list(
+        contractor.projects.active_with_totals().only("contractor", "name", "start_date")
+    )
+
+
 @login_required
 def select_job_entry_project(request):
     contractor, missing_response = require_contractor(request)
     if missing_response:
         return missing_response
 
-    projects = contractor.projects.filter(
-        end_date__isnull=True
-    ).prefetch_related("job_entries", "payments")
+    projects = _select_project_choices(contractor)
 
-    for p in projects:
-        p.total_billable = sum((je.billable_amount or 0) for je in p.job_entries.all())
-        p.total_payments = sum((pay.amount or 0) for pay in p.payments.all())
-        p.outstanding = p.total_billable - p.total_payments
-
-    if not projects.exists():
+    if not projects:
         messages.info(request, "Please create a project before adding job entries.")
         return redirect("dashboard:project_list")
 
@@ -773,16 +1046,9 @@ def select_payment_project(request):
     if missing_response:
         return missing_response
 
-    projects = contractor.projects.filter(
-        end_date__isnull=True
-    ).prefetch_related("job_entries", "payments")
-
-    for p in projects:
-        p.total_billable = sum((je.billable_amount or 0) for je in p.job_entries.all())
-        p.total_payments = sum((pay.amount or 0) for pay in p.payments.all())
-        p.outstanding = p.total_billable - p.total_payments
+    projects = _select_project_choices(contractor)
 
-    if not projects.exists():
+    if not projects:
         messages.info(request, "Please create a project before recording payments.")
         return redirect("dashboard:project_list")
 
@@ -803,74 +1069,79 @@ def add_job_entry(request, pk):
     if missing_response:
         return missing_response
 
-    project = get_object_or_404(Project, pk=pk, contractor=contractor)
+    # Fetch through the related manager so project.contractor is the already
+    # loaded contractor; calculate_amounts() reads it for every new entry.
+    project = get_object_or_404(contractor.projects, pk=pk)
     assets = contractor.assets.all()
     employees = contractor.employees.all()
 
     if request.method == "POST":
         date = request.POST.get("date")
-        entries_created = 0
+        new_entries = []
+        invalid_rows = 0
 
         # Process labor/equipment entries
-        hours_list = request.POST.getlist("hours[]") or request.POST.getlist("hours")
-        asset_ids = request.POST.getlist("asset[]") or request.POST.getlist("asset")
-        employee_ids = request.POST.getlist("employee[]") or request.POST.getlist("employee")
-        descriptions = request.POST.getlist("description[]") or request.POST.getlist("description")
+        labor_entries = _posted_rows(
+            request.POST, "hours", "asset", "employee", "description"
+        )
+        assets_by_pk = _by_pk(assets, [row[1] for row in labor_entries])
+        employees_by_pk = _by_pk(employees, [row[2] for row in labor_entries])
 
-        # Create labor/equipment entries
-        labor_entries = zip(hours_list, asset_ids, employee_ids, descriptions)
         for hours, asset_id, employee_id, desc in labor_entries:
             if not any([hours, asset_id, employee_id, desc]):
                 continue
 
-            asset = assets.filter(pk=asset_id).first() if asset_id else None
-            employee = employees.filter(pk=employee_id).first() if employee_id else None
-            hours_dec = Decimal(hours or 0)
+            asset = assets_by_pk.get(asset_id) if asset_id else None
+            employee = employees_by_pk.get(employee_id) if employee_id else None
+            hours_dec = _posted_decimal(hours)
+            if hours_dec is None:
+                invalid_rows += 1
+                continue
 
             if hours_dec > 0 or asset or employee:
-                JobEntry.objects.create(
-                    project=project,
-                    date=date,
-                    hours=hours_dec,
-                    asset=asset,
-                    employee=employee,
-                    material_description="",
-                    material_cost=None,
-                    description=desc or "",
+                new_entries.append(
+                    JobEntry(
+                        project=project,
+                        date=date,
+                        hours=hours_dec,
+                        asset=asset,
+                        employee=employee,
+                        material_description="",
+                        material_cost=None,
+                        description=desc or "",
+                    )
                 )
-                entries_created += 1
 
         # Process materials entries
-        material_descriptions = request.POST.getlist("material_description[]")
-        material_quantities = request.POST.getlist("material_quantity[]")
-        material_units = request.POST.getlist("material_unit[]")
-        material_costs = request.POST.getlist("material_cost[]")
-
-        if material_descriptions:
-            materials = zip(
-                material_descriptions,
-                material_quantities,
-                material_units,
-                material_costs,
-            )
-            for desc, qty, unit, cost in materials:
-                if not any([desc, qty, cost]):
-                    continue
-
-                qty_dec = Decimal(qty or 0)
-                cost_dec = Decimal(cost or 0)
-
-                if desc and qty_dec > 0 and cost_dec > 0:
-                    # Create material entry with description including unit
-                    suffix = f"({qty_dec} {unit})" if unit else ""
-                    desc_stripped = desc.strip()
-                    full_desc = (
-                        f"{desc_stripped} {suffix}".strip()
-                        if suffix and not desc_stripped.endswith(suffix)
-                        else desc_stripped
-                    )
+        materials = _posted_rows(
+            request.POST,
+            "material_description",
+            "material_quantity",
+            "material_unit",
+            "material_cost",
+        )
+        for desc, qty, unit, cost in materials:
+            if not any([desc, qty, cost]):
+                continue
+
+            qty_dec = _posted_decimal(qty)
+            cost_dec = _posted_decimal(cost)
+            if qty_dec is None or cost_dec is None:
+                invalid_rows += 1
+                continue
 
-                    JobEntry.objects.create(
+            if desc and qty_dec > 0 and cost_dec > 0:
+                # Create material entry with description including unit
+                suffix = f"({qty_dec} {unit})" if unit else ""
+                desc_stripped = desc.strip()
+                full_desc = (
+                    f"{desc_stripped} {suffix}".strip()
+                    if suffix and not desc_stripped.endswith(suffix)
+                    else desc_stripped
+                )
+
+                new_entries.append(
+                    JobEntry(
                         project=project,
                         date=date,
                         hours=qty_dec,  # Use quantity as hours for materials
@@ -880,7 +1151,25 @@ def add_job_entry(request, pk):
                         material_cost=cost_dec,
                         description=f"Material: {full_desc}",
                     )
-                    entries_created += 1
+                )
+
+        # Validate every row before writing any, so a typo in one row doesn't
+        # leave the rest of the submission half saved (or raise a 500).
+        if invalid_rows:
+            messages.error(
+                request,
+                "Hours, quantities and costs must be numbers. No entries were created.",
+            )
+            return redirect("dashboard:add_job_entry", pk=project.pk)
+
+        # bulk_create skips save(), so compute the amounts up front and write
+        # every row in a single INSERT inside one transaction; the manager
+        # touches the project.
+        for entry in new_entries:
+            entry.calculate_amounts()
+        with transaction.atomic():
+            JobEntry.objects.bulk_create(new_entries, batch_size=200)
+        entries_created = len(new_entries)
 
         if entries_created > 0:
             messages.success(
@@ -912,7 +1201,12 @@ def edit_job_entry(request, pk):
     if missing_response:
         return missing_response
 
-    entry = get_object_or_404(JobEntry, pk=pk, project__contractor=contractor)
+    # save() recomputes amounts from project.contractor, so join it up front.
+    entry = get_object_or_404(
+        JobEntry.objects.select_related("project__contractor"),
+        pk=pk,
+        project__contractor=contractor,
+    )
     assets = contractor.assets.all()
     employees = contractor.employees.all()
 
@@ -935,7 +1229,7 @@ def edit_job_entry(request, pk):
 
         entry.save()
         messages.success(request, "Job entry updated successfully.")
-        return redirect("dashboard:project_detail", pk=entry.project.pk)
+        return redirect("dashboard:project_detail", pk=entry.project_id)
 
     return render(
         request,
@@ -954,7 +1248,7 @@ def add_payment(request, pk):
     if missing_response:
         return missing_response
 
-    project = get_object_or_404(Project, pk=pk, contractor=contractor)
+    project = get_object_or_404(contractor.projects, pk=pk)
 
     if request.method == "POST":
         date = request.POST.get("date")
@@ -982,39 +1276,34 @@ def add_payment(request, pk):
     )
 
 
-@login_required
-def contractor_report(request):
-    contractor, missing_response = require_contractor(request)
-    if missing_response:
-        return missing_response
-
-    projects_qs = contractor.projects.annotate(
-        total_cost=Sum("job_entries__cost_amount"),
-        total_billable=Sum("job_entries__billable_amount"),
-    )
+def _contractor_report_data(projects_qs):
+    """Return per-project profit rows and portfolio totals for contractor_report."""
+    zero = Value(ZERO)
+    projects_qs = projects_qs.annotate(
+        total_cost=Coalesce(Sum("job_entries__cost_amount"), zero),
+        total_billable=Coalesce(Sum("job_entries__billable_amount"), zero),
+    ).annotate(profit=F("total_billable") - F("total_cost"))
 
     projects = []
-    total_revenue = Decimal("0")
-    total_cost = Decimal("0")
-    total_profit = Decimal("0")
-    total_margin = Decimal("0")
+    total_revenue = ZERO
+    total_cost = ZERO
+    total_margin = ZERO
     profitable = 0
     breakeven = 0
     unprofitable = 0
 
-    for p in projects_qs.iterator():
-        billable = p.total_billable or Decimal("0")
-        cost = p.total_cost or Decimal("0")
-        profit = billable - cost
-        margin = (profit / billable * Decimal("100")) if billable else Decimal("0")
+    # The table needs every row's profit and margin, so the portfolio totals
+    # are accumulated in the same single pass rather than a second aggregate.
+    for p in projects_qs:
+        billable = p.total_billable
+        profit = p.profit
+        margin = (profit / billable * HUNDRED) if billable else ZERO
 
-        p.profit = profit
         p.margin = margin
         projects.append(p)
 
         total_revenue += billable
-        total_cost += cost
-        total_profit += profit
+        total_cost += p.total_cost
         total_margin += margin
 
         if profit > 100:
@@ -1024,14 +1313,12 @@ def contractor_report(request):
         else:
             unprofitable += 1
 
-    avg_margin = (total_margin / len(projects)) if projects else Decimal("0")
-    roi = (total_profit / total_cost * Decimal("100")) if total_cost else None
+    total_profit = total_revenue - total_cost
+    avg_margin = (total_margin / len(projects)) if projects else ZERO
+    roi = (total_profit / total_cost * HUNDRED) if total_cost else None
 
-    export_pdf = request.GET.get("export") == "pdf"
-    context = {
-        "contractor": contractor,
+    return {
         "projects": projects,
-        "report": export_pdf,
         "total_revenue": total_revenue,
         "total_cost": total_cost,
         "total_profit": total_profit,
@@ -1042,12 +1329,76 @@ def contractor_report(request):
         "unprofitable_count": unprofitable,
     }
 
+
+@login_required
+def contractor_report(request):
+    contractor, missing_response = require_contractor(request)
+    if missing_response:
+        return missing_response
+
+    # Optional ?year=YYYY limits the report (and its totals) to entries logged
+    # in that year, keeping large portfolios manageable in PDF form.
+    year = request.GET.get("year", "")
+    projects_qs = contractor.projects.only("contractor", "name")
+    # Out-of-range years (0, 10000, ...) can't be turned into a date range,
+    # so they are ignored like any other invalid value.
+    if year.isdigit() and MINYEAR <= int(year) <= MAXYEAR:
+        projects_qs = projects_qs.filter(job_entries__date__year=int(year))
+    else:
+        year = ""
+
+    # Totals only change when a project, entry or payment does, so repeat
+    # views are served from the cache until the projects' version moves.
+    cache_key = "contractor_report:{}:{}:{}".format(
+        contractor.pk, year, _projects_version(contractor.projects.all())
+    )
+    data = cache.get(cache_key)
+    if data is None:
+        data = _contractor_report_data(projects_qs)
+        cache.set(cache_key, data, 60 * 60)
+    projects = data["projects"]
+
+    export_pdf = request.GET.get("export") == "pdf"
+    page_obj = None
+    project_count = len(projects)
+    if not export_pdf:
+        page_obj = Paginator(projects, 50).get_page(request.GET.get("page"))
+        projects = page_obj.object_list
+
+    context = {
+        "contractor": contractor,
+        "projects": projects,
+        "page_obj": page_obj,
+        "project_count": project_count,
+        "year": year,
+        "report": export_pdf,
+        "total_revenue": data["total_revenue"],
+        "total_cost": data["total_cost"],
+        "total_profit": data["total_profit"],
+        "average_margin": data["average_margin"],
+        "roi": data["roi"],
+        "profitable_count": data["profitable_count"],
+        "breakeven_count": data["breakeven_count"],
+        "unprofitable_count": data["unprofitable_count"],
+    }
+
     if export_pdf:
+        # The PDF is the slow part of this report, so it is cached alongside
+        # the data. Saving a contractor doesn't move the projects' version, so
+        # the contractor details the document prints (name, email, logo) are
+        # hashed into the key along with the date.
+        letterhead = "\0".join(
+            (contractor.name, contractor.email, contractor.logo.name or "")
+        )
+        letterhead = hashlib.md5(letterhead.encode()).hexdigest()
         pdf = _render_pdf(
             "dashboard/contractor_report.html",
             context,
             "contractor_summary_report.pdf",
             request=request,
+            cache_key="{}:pdf:{}:{}".format(
+                cache_key, timezone.localdate().isoformat(), letterhead
+            ),
         )
         if pdf:
             return pdf
@@ -1061,15 +1412,21 @@ def customer_report(request, pk):
     if missing_response:
         return missing_response
 
-    project = get_object_or_404(Project, pk=pk, contractor=contractor)
-    entries_qs = project.job_entries.select_related("asset", "employee").order_by(
-        "-date"
+    project = get_object_or_404(contractor.projects, pk=pk)
+    entries_qs = (
+        project.job_entries.select_related("asset", "employee")
+        .only(*REPORT_ENTRY_FIELDS)
+        .order_by("-date")
     )
     entries = list(entries_qs)
-    total = project.job_entries.aggregate(total=Sum("billable_amount"))["total"] or 0
-    payments = list(project.payments.all())
-    total_payments = project.payments.aggregate(total=Sum("amount"))["total"] or 0
-    outstanding = total - (total_payments or 0)
+    # The customer copy lists payments by date and amount only, so the notes
+    # text is left in the database.
+    payments = list(project.payments.only("project", "date", "amount"))
+    # Both lists are loaded in full for the report, so the totals are summed
+    # from them rather than with two more aggregate queries.
+    total = sum((e.billable_amount for e in entries), ZERO)
+    total_payments = sum((p.amount for p in payments), ZERO)
+    outstanding = total - total_payments
 
     export_pdf = request.GET.get("export") == "pdf"
 
@@ -1082,7 +1439,7 @@ def customer_report(request, pk):
         "colspan_before_total": 6,
         "total_columns": 7,
         "payments": payments,
-        "total_payments": total_payments or 0,
+        "total_payments": total_payments,
         "outstanding": outstanding,
     }
 
@@ -1105,19 +1462,21 @@ def contractor_job_report(request, pk):
     if missing_response:
         return missing_response
 
-    project = get_object_or_404(Project, pk=pk, contractor=contractor)
-    entries_qs = project.job_entries.select_related("asset", "employee").order_by(
-        "-date"
+    project = get_object_or_404(contractor.projects, pk=pk)
+    entries_qs = (
+        project.job_entries.select_related("asset", "employee")
+        .only(*REPORT_ENTRY_FIELDS)
+        .order_by("-date")
     )
     entries = []
-    total_billable = Decimal("0")
-    total_cost = Decimal("0")
+    total_billable = ZERO
+    total_cost = ZERO
 
-    for e in entries_qs.iterator():
-        billable = e.billable_amount or Decimal("0")
-        cost = e.cost_amount or Decimal("0")
+    for e in entries_qs:
+        billable = e.billable_amount or ZERO
+        cost = e.cost_amount or ZERO
         profit = billable - cost
-        margin = (profit / billable * Decimal("100")) if billable else Decimal("0")
+        margin = (profit / billable * HUNDRED) if billable else ZERO
 
         e.profit = profit
         e.margin = margin
@@ -1127,14 +1486,14 @@ def contractor_job_report(request, pk):
 
     total_profit = total_billable - total_cost
     overall_margin = (
-        (total_profit / total_billable) * Decimal("100")
+        (total_profit / total_billable) * HUNDRED
         if total_billable
-        else Decimal("0")
+        else ZERO
     )
 
     payments = list(project.payments.all())
-    total_payments = project.payments.aggregate(total=Sum("amount"))["total"] or 0
-    outstanding = total_billable - (total_payments or 0)
+    total_payments = sum((p.amount for p in payments), ZERO)
+    outstanding = total_billable - total_payments
 
     export_pdf = request.GET.get("export") == "pdf"
 
@@ -1148,7 +1507,7 @@ def contractor_job_report(request, pk):
         "overall_margin": overall_margin,
         "report": export_pdf,
         "payments": payments,
-        "total_payments": total_payments or 0,
+        "total_payments": total_payments,
         "outstanding": outstanding,
         "colspan_before_total": 6,
         "total_columns": 10,
@@ -1173,32 +1532,26 @@ def job_estimate_report(request, pk):
     if missing_response:
         return missing_response
 
-    estimate = get_object_or_404(Estimate, pk=pk, contractor=contractor)
-    entries = estimate.entries.all()
-
-    labor_total = (
-        entries.filter(material_cost__isnull=True).aggregate(total=Sum("billable_amount"))[
-            "total"
-        ]
-        or Decimal("0")
-    )
-    material_entries = entries.filter(material_cost__isnull=False)
-    material_total = (
-        material_entries.aggregate(total=Sum("billable_amount"))["total"]
-        or Decimal("0")
-    )
-    service_total = (
-        material_entries.filter(service_markup__gt=0).aggregate(
-            total=Sum("billable_amount")
-        )["total"]
-        or Decimal("0")
+    # The report prints the estimate's name next to its totals, so the wide
+    # customer and terms text columns are not loaded.
+    estimate = get_object_or_404(contractor.estimates.only("contractor", "name"), pk=pk)
+    # All four totals come from one pass over the estimate's entries.
+    totals = estimate.entries.aggregate(
+        labor=Sum("billable_amount", filter=Q(material_cost__isnull=True)),
+        material=Sum("billable_amount", filter=Q(material_cost__isnull=False)),
+        service=Sum(
+            "billable_amount",
+            filter=Q(material_cost__isnull=False, service_markup__gt=0),
+        ),
+        cost=Sum("cost_amount"),
     )
+    labor_total = totals["labor"] or ZERO
+    material_total = totals["material"] or ZERO
+    service_total = totals["service"] or ZERO
     billable_total = labor_total + material_total + service_total
-    cost_total = (
-        entries.aggregate(total=Sum("cost_amount"))["total"] or Decimal("0")
-    )
+    cost_total = totals["cost"] or ZERO
     profit = billable_total - cost_total
-    margin = (profit / billable_total * 100) if billable_total else Decimal("0")
+    margin = (profit / billable_total * 100) if billable_total else ZERO
 
     export_pdf = request.GET.get("export") == "pdf"
 
@@ -1229,6 +1582,9 @@ def job_estimate_report(request, pk):
 
 
 # API endpoints for enhanced functionality
+SEARCH_RESULT_LIMIT = 10
+
+
 @login_required
 def search_entries(request):
     """API endpoint for searching entries"""
@@ -1245,28 +1601,89 @@ def search_entries(request):
         entries = entries.filter(project_id=project_id)
 
     if query:
-        entries = entries.filter(
-            Q(description__icontains=query)
-            | Q(material_description__icontains=query)
-            | Q(asset__name__icontains=query)
-            | Q(employee__name__icontains=query)
-        )
+        entries = entries.filter(_entry_search_q(contractor, query))
+
+    # Only the serialized columns are selected (the project name through the
+    # join, the amount already as text), so no model instances or Decimals
+    # are built for the response. Rows are streamed rather than cached on
+    # the queryset, and islice keeps the cap in place even if the SQL limit
+    # is ever widened.
+    rows = (
+        entries.order_by("-date")
+        .annotate(amount=MoneyText("billable_amount"))
+        .values("id", "date", "description", "amount", "project__name")
+    )[:SEARCH_RESULT_LIMIT].iterator(chunk_size=SEARCH_RESULT_LIMIT)
+
+    results = [
+        {
+            "id": row["id"],
+            "date": row["date"],
+            "description": row["description"],
+            "amount": row["amount"],
+            "project": row["project__name"],
+        }
+        for row in islice(rows, SEARCH_RESULT_LIMIT)
+    ]
+
+    return _json_response({"results": results})
 
-    entries = entries.order_by("-date")
 
-    results = []
-    for entry in entries[:10]:  # Limit results
-        results.append(
+# This could be expanded to store actual templates in the database
+# For now, return some common templates
+MATERIAL_TEMPLATES = (
+    {
+        "name": "Office Supplies Basic",
+        "materials": [
             {
-                "id": entry.id,
-                "date": entry.date.strftime("%Y-%m-%d"),
-                "description": entry.description,
-                "amount": str(entry.billable_amount),
-                "project": entry.project.name,
-            }
-        )
+                "description": "Office Supplies - Basic",
+                "quantity": 1,
+                "unit": "Each",
+                "cost": 25.00,
+            },
+            {
+                "description": "Printer Paper",
+                "quantity": 5,
+                "unit": "Reams",
+                "cost": 8.50,
+            },
+            {
+                "description": "Writing Supplies",
+                "quantity": 1,
+                "unit": "Set",
+                "cost": 15.00,
+            },
+        ],
+    },
+    {
+        "name": "Basic Maintenance",
+        "materials": [
+            {
+                "description": "Cleaning Supplies",
+                "quantity": 1,
+                "unit": "Each",
+                "cost": 15.00,
+            },
+            {
+                "description": "Safety Equipment",
+                "quantity": 1,
+                "unit": "Each",
+                "cost": 45.00,
+            },
+            {
+                "description": "Maintenance Tools",
+                "quantity": 1,
+                "unit": "Set",
+                "cost": 35.00,
+            },
+        ],
+    },
+)
 
-    return JsonResponse({"results": results})
+# The templates never change at runtime, so the JSON body (already encoded,
+# so HttpResponse has nothing to convert) and its ETag are built once at
+# import instead of on every request.
+MATERIAL_TEMPLATES_JSON = json.dumps({"templates": MATERIAL_TEMPLATES}).encode()
+MATERIAL_TEMPLATES_ETAG = '"{}"'.format(hashlib.md5(MATERIAL_TEMPLATES_JSON).hexdigest())
 
 
 @login_required
@@ -1276,58 +1693,12 @@ def get_material_templates(request):
     if contractor is None:
         return JsonResponse({"error": "Unauthorized"}, status=401)
 
-    # This could be expanded to store actual templates in the database
-    # For now, return some common templates
-    templates = [
-        {
-            "name": "Office Supplies Basic",
-            "materials": [
-                {
-                    "description": "Office Supplies - Basic",
-                    "quantity": 1,
-                    "unit": "Each",
-                    "cost": 25.00,
-                },
-                {
-                    "description": "Printer Paper",
-                    "quantity": 5,
-                    "unit": "Reams",
-                    "cost": 8.50,
-                },
-                {
-                    "description": "Writing Supplies",
-                    "quantity": 1,
-                    "unit": "Set",
-                    "cost": 15.00,
-                },
-            ],
-        },
-        {
-            "name": "Basic Maintenance",
-            "materials": [
-                {
-                    "description": "Cleaning Supplies",
-                    "quantity": 1,
-                    "unit": "Each",
-                    "cost": 15.00,
-                },
-                {
-                    "description": "Safety Equipment",
-                    "quantity": 1,
-                    "unit": "Each",
-                    "cost": 45.00,
-                },
-                {
-                    "description": "Maintenance Tools",
-                    "quantity": 1,
-                    "unit": "Set",
-                    "cost": 35.00,
-                },
-            ],
-        },
-    ]
-
-    return JsonResponse({"templates": templates})
+    response = HttpResponse(MATERIAL_TEMPLATES_JSON, content_type="application/json")
+    response["ETag"] = MATERIAL_TEMPLATES_ETAG
+    patch_cache_control(response, private=True, max_age=60 * 60 * 24)
+    return get_conditional_response(
+        request, etag=MATERIAL_TEMPLATES_ETAG, response=response
+    )
 
 
 # Add these views to the existing views.py file
@@ -1343,10 +1714,7 @@ def create_estimate(request):
 
     if request.method == "POST":
         try:
-            # Debug: Print all POST data
-            print("=== CREATE ESTIMATE DEBUG ===")
-            print("POST data keys:", list(request.POST.keys()))
-            print("Form data:", dict(request.POST))
+            logger.debug("Create estimate form data: %s", request.POST)
             
             # Create the estimate with proper error handling
             estimate_data = {
@@ -1368,26 +1736,27 @@ def create_estimate(request):
                 'valid_until': request.POST.get("valid_until") or None,
             }
             
-            print("Creating estimate with data:", estimate_data)
-            estimate = Estimate.objects.create(**estimate_data)
-            print("Estimate created with ID:", estimate.id)
-
-            entries_created = 0
+            # Saved together with its entries below; the entries can already
+            # point at it, Django fills in the id once it has one.
+            estimate = Estimate(**estimate_data)
+            new_entries = []
             date = request.POST.get("created_date")
             
             if not date:
-                date = timezone.now().date()
+                date = timezone.localdate()
 
             # Process labor/equipment entries
             hours_list = request.POST.getlist("hours[]")
             asset_ids = request.POST.getlist("asset[]")
             employee_ids = request.POST.getlist("employee[]")
             descriptions = request.POST.getlist("description[]")
+            assets_by_pk = _by_pk(assets, asset_ids)
+            employees_by_pk = _by_pk(employees, employee_ids)
 
-            print("Labor entries - Hours:", hours_list)
-            print("Labor entries - Assets:", asset_ids)
-            print("Labor entries - Employees:", employee_ids)
-            print("Labor entries - Descriptions:", descriptions)
+            logger.debug("Labor entries - Hours: %s", hours_list)
+            logger.debug("Labor entries - Assets: %s", asset_ids)
+            logger.debug("Labor entries - Employees: %s", employee_ids)
+            logger.debug("Labor entries - Descriptions: %s", descriptions)
 
             # Create labor/equipment entries
             if hours_list:
@@ -1400,28 +1769,29 @@ def create_estimate(request):
                         employee = None
                         
                         if asset_id:
-                            asset = assets.filter(pk=asset_id).first()
+                            asset = assets_by_pk.get(asset_id)
                         if employee_id:
-                            employee = employees.filter(pk=employee_id).first()
+                            employee = employees_by_pk.get(employee_id)
                             
                         hours_dec = Decimal(hours or 0)
 
                         if hours_dec > 0 and (asset or employee):
-                            EstimateEntry.objects.create(
-                                estimate=estimate,
-                                date=date,
-                                hours=hours_dec,
-                                asset=asset,
-                                employee=employee,
-                                material_description="",
-                                material_cost=None,
-                                description=desc or "",
+                            new_entries.append(
+                                EstimateEntry(
+                                    estimate=estimate,
+                                    date=date,
+                                    hours=hours_dec,
+                                    asset=asset,
+                                    employee=employee,
+                                    material_description="",
+                                    material_cost=None,
+                                    description=desc or "",
+                                )
                             )
-                            entries_created += 1
-                            print(f"Created labor entry {i+1}")
+                            logger.debug("Added labor entry %s", i + 1)
                             
                     except Exception as e:
-                        print(f"Error creating labor entry {i+1}: {e}")
+                        logger.warning("Error creating labor entry %s: %s", i + 1, e)
                         continue
 
             # Process materials entries
@@ -1430,10 +1800,10 @@ def create_estimate(request):
             material_units = request.POST.getlist("material_unit[]")
             material_costs = request.POST.getlist("material_cost[]")
 
-            print("Material entries - Descriptions:", material_descriptions)
-            print("Material entries - Quantities:", material_quantities)
-            print("Material entries - Units:", material_units)
-            print("Material entries - Costs:", material_costs)
+            logger.debug("Material entries - Descriptions: %s", material_descriptions)
+            logger.debug("Material entries - Quantities: %s", material_quantities)
+            logger.debug("Material entries - Units: %s", material_units)
+            logger.debug("Material entries - Costs: %s", material_costs)
 
             if material_descriptions:
                 for i, (desc, qty, unit, cost) in enumerate(zip(
@@ -1455,21 +1825,22 @@ def create_estimate(request):
                                 else desc_stripped
                             )
 
-                            EstimateEntry.objects.create(
-                                estimate=estimate,
-                                date=date,
-                                hours=qty_dec,
-                                asset=None,
-                                employee=None,
-                                material_description=full_desc,
-                                material_cost=cost_dec,
-                                description=f"Material: {full_desc}",
+                            new_entries.append(
+                                EstimateEntry(
+                                    estimate=estimate,
+                                    date=date,
+                                    hours=qty_dec,
+                                    asset=None,
+                                    employee=None,
+                                    material_description=full_desc,
+                                    material_cost=cost_dec,
+                                    description=f"Material: {full_desc}",
+                                )
                             )
-                            entries_created += 1
-                            print(f"Created material entry {i+1}")
+                            logger.debug("Added material entry %s", i + 1)
                             
                     except Exception as e:
-                        print(f"Error creating material entry {i+1}: {e}")
+                        logger.warning("Error creating material entry %s: %s", i + 1, e)
                         continue
 
             # Process services entries
@@ -1479,11 +1850,11 @@ def create_estimate(request):
             service_costs = request.POST.getlist("service_cost[]")
             service_markups = request.POST.getlist("service_markup[]")
 
-            print("Service entries - Descriptions:", service_descriptions)
-            print("Service entries - Quantities:", service_quantities)
-            print("Service entries - Units:", service_units)
-            print("Service entries - Costs:", service_costs)
-            print("Service entries - Markups:", service_markups)
+            logger.debug("Service entries - Descriptions: %s", service_descriptions)
+            logger.debug("Service entries - Quantities: %s", service_quantities)
+            logger.debug("Service entries - Units: %s", service_units)
+            logger.debug("Service entries - Costs: %s", service_costs)
+            logger.debug("Service entries - Markups: %s", service_markups)
 
             if service_descriptions:
                 for i, (desc, qty, unit, cost, markup) in enumerate(zip(
@@ -1506,25 +1877,34 @@ def create_estimate(request):
                                 else desc_stripped
                             )
 
-                            EstimateEntry.objects.create(
-                                estimate=estimate,
-                                date=date,
-                                hours=qty_dec,
-                                asset=None,
-                                employee=None,
-                                material_description=full_desc,
-                                material_cost=cost_dec,
-                                service_markup=markup_dec,
-                                description=f"Outside Service: {full_desc}",
+                            new_entries.append(
+                                EstimateEntry(
+                                    estimate=estimate,
+                                    date=date,
+                                    hours=qty_dec,
+                                    asset=None,
+                                    employee=None,
+                                    material_description=full_desc,
+                                    material_cost=cost_dec,
+                                    service_markup=markup_dec,
+                                    description=f"Outside Service: {full_desc}",
+                                )
                             )
-                            entries_created += 1
-                            print(f"Created service entry {i+1}")
+                            logger.debug("Added service entry %s", i + 1)
                             
                     except Exception as e:
-                        print(f"Error creating service entry {i+1}: {e}")
+                        logger.warning("Error creating service entry %s: %s", i + 1, e)
                         continue
 
-            print(f"Total entries created: {entries_created}")
+            # bulk_create skips save(), so compute the amounts up front; the
+            # estimate and all of its rows are then written in one transaction.
+            for entry in new_entries:
+                entry.calculate_amounts()
+            with transaction.atomic():
+                estimate.save()
+                EstimateEntry.objects.bulk_create(new_entries, batch_size=200)
+            entries_created = len(new_entries)
+            logger.debug("Created %s entries for estimate %s", entries_created, estimate.pk)
 
             if entries_created > 0:
                 messages.success(
@@ -1536,9 +1916,7 @@ def create_estimate(request):
             return redirect("dashboard:estimate_list")
             
         except Exception as e:
-            print(f"ERROR in create_estimate: {e}")
-            import traceback
-            traceback.print_exc()
+            logger.exception("Error creating estimate")
             messages.error(request, f"Error creating estimate: {e}")
             return redirect("dashboard:estimate_list")
 
@@ -1561,200 +1939,211 @@ def edit_estimate(request, pk):
     if missing_response:
         return missing_response
 
-    estimate = get_object_or_404(Estimate, pk=pk, contractor=contractor)
+    estimate = get_object_or_404(contractor.estimates, pk=pk)
     assets = contractor.assets.all()
     employees = contractor.employees.all()
 
     if request.method == "POST":
         try:
-            # Update the estimate basic information
-            estimate.name = request.POST.get("name")
-            estimate.estimate_number = request.POST.get("estimate_number", "")
-            estimate.customer_name = request.POST.get("customer_name")
-            estimate.customer_email = request.POST.get("customer_email", "")
-            estimate.customer_phone = request.POST.get("customer_phone", "")
-            estimate.customer_address = request.POST.get("customer_address", "")
-            estimate.project_location = request.POST.get("project_location")
-            estimate.project_description = request.POST.get("project_description", "")
-            estimate.payment_terms = request.POST.get("payment_terms", "")
-            estimate.exclusions = request.POST.get("exclusions", "")
-            estimate.special_terms = request.POST.get("special_terms", "")
-            estimate.liability_statement = request.POST.get("liability_statement", "")
-            estimate.notes = request.POST.get("notes", "")
-            estimate.created_date = request.POST.get("created_date")
-            estimate.valid_until = request.POST.get("valid_until") or None
-            estimate.save()
-
-            # Process existing and new line items
-            processed_entry_ids = set()
-            processed_material_ids = set()
-            processed_service_ids = set()
-
-            date = request.POST.get("created_date")
-
-            # Process labor/equipment entries
-            hours_list = request.POST.getlist("hours[]")
-            asset_ids = request.POST.getlist("asset[]")
-            employee_ids = request.POST.getlist("employee[]")
-            descriptions = request.POST.getlist("description[]")
-            entry_ids = request.POST.getlist("entry_id[]")
-
-            for i, (hours, asset_id, employee_id, desc, entry_id) in enumerate(zip(
-                hours_list, asset_ids, employee_ids, descriptions, entry_ids
-            )):
-                # Skip empty entries
-                if not any([hours, asset_id, employee_id]):
-                    continue
-
-                hours_dec = Decimal(hours or 0)
-                if hours_dec <= 0 and not asset_id and not employee_id:
-                    continue
-
-                asset = assets.filter(pk=asset_id).first() if asset_id else None
-                employee = employees.filter(pk=employee_id).first() if employee_id else None
+            # The header, the row updates, the deletes and the new rows are
+            # saved together, so a failure part way leaves the estimate as it was.
+            with transaction.atomic():
+                # Update the estimate basic information
+                estimate.name = request.POST.get("name")
+                estimate.estimate_number = request.POST.get("estimate_number", "")
+                estimate.customer_name = request.POST.get("customer_name")
+                estimate.customer_email = request.POST.get("customer_email", "")
+                estimate.customer_phone = request.POST.get("customer_phone", "")
+                estimate.customer_address = request.POST.get("customer_address", "")
+                estimate.project_location = request.POST.get("project_location")
+                estimate.project_description = request.POST.get("project_description", "")
+                estimate.payment_terms = request.POST.get("payment_terms", "")
+                estimate.exclusions = request.POST.get("exclusions", "")
+                estimate.special_terms = request.POST.get("special_terms", "")
+                estimate.liability_statement = request.POST.get("liability_statement", "")
+                estimate.notes = request.POST.get("notes", "")
+                estimate.created_date = request.POST.get("created_date")
+                estimate.valid_until = request.POST.get("valid_until") or None
+                estimate.save()
+
+                # Process existing and new line items
+                processed_entry_ids = set()
+                processed_material_ids = set()
+                processed_service_ids = set()
+                new_entries = []
+                # The posted ids are resolved against the estimate's rows loaded in
+                # one query, rather than a get() per submitted row.
+                existing_entries = {str(entry.pk): entry for entry in estimate.entries.all()}
+
+                date = request.POST.get("created_date")
+
+                # Process labor/equipment entries
+                hours_list = request.POST.getlist("hours[]")
+                asset_ids = request.POST.getlist("asset[]")
+                employee_ids = request.POST.getlist("employee[]")
+                descriptions = request.POST.getlist("description[]")
+                entry_ids = request.POST.getlist("entry_id[]")
+                assets_by_pk = _by_pk(assets, asset_ids)
+                employees_by_pk = _by_pk(employees, employee_ids)
+
+                for i, (hours, asset_id, employee_id, desc, entry_id) in enumerate(zip(
+                    hours_list, asset_ids, employee_ids, descriptions, entry_ids
+                )):
+                    # Skip empty entries
+                    if not any([hours, asset_id, employee_id]):
+                        continue
 
-                if entry_id:
-                    # Update existing entry
-                    try:
-                        entry = EstimateEntry.objects.get(pk=entry_id, estimate=estimate)
-                        entry.hours = hours_dec
-                        entry.asset = asset
-                        entry.employee = employee
-                        entry.description = desc or ""
-                        entry.material_description = ""
-                        entry.material_cost = None
-                        entry.save()
-                        processed_entry_ids.add(int(entry_id))
-                    except EstimateEntry.DoesNotExist:
-                        pass
-                else:
-                    # Create new entry
-                    EstimateEntry.objects.create(
-                        estimate=estimate,
-                        date=date,
-                        hours=hours_dec,
-                        asset=asset,
-                        employee=employee,
-                        material_description="",
-                        material_cost=None,
-                        description=desc or "",
-                    )
+                    hours_dec = Decimal(hours or 0)
+                    if hours_dec <= 0 and not asset_id and not employee_id:
+                        continue
 
-            # Process materials entries
-            material_descriptions = request.POST.getlist("material_description[]")
-            material_quantities = request.POST.getlist("material_quantity[]")
-            material_units = request.POST.getlist("material_unit[]")
-            material_costs = request.POST.getlist("material_cost[]")
-            material_entry_ids = request.POST.getlist("material_entry_id[]")
-
-            for i, (desc, qty, unit, cost, entry_id) in enumerate(zip(
-                material_descriptions, material_quantities, material_units, 
-                material_costs, material_entry_ids
-            )):
-                if not desc or not qty or not cost:
-                    continue
-
-                qty_dec = Decimal(qty or 0)
-                cost_dec = Decimal(cost or 0)
-
-                if desc and qty_dec > 0 and cost_dec > 0:
-                    suffix = f"({qty_dec} {unit})" if unit else ""
-                    desc_stripped = desc.strip()
-                    full_desc = (
-                        f"{desc_stripped} {suffix}".strip()
-                        if suffix and not desc_stripped.endswith(suffix)
-                        else desc_stripped
-                    )
+                    asset = assets_by_pk.get(asset_id) if asset_id else None
+                    employee = employees_by_pk.get(employee_id) if employee_id else None
 
                     if entry_id:
                         # Update existing entry
-                        try:
-                            entry = EstimateEntry.objects.get(pk=entry_id, estimate=estimate)
-                            entry.hours = qty_dec
-                            entry.material_description = full_desc
-                            entry.material_cost = cost_dec
-                            entry.description = f"Material: {full_desc}"
-                            entry.asset = None
-                            entry.employee = None
+                        entry = existing_entries.get(entry_id)
+                        if entry is not None:
+                            entry.hours = hours_dec
+                            entry.asset = asset
+                            entry.employee = employee
+                            entry.description = desc or ""
+                            entry.material_description = ""
+                            entry.material_cost = None
                             entry.save()
-                            processed_material_ids.add(int(entry_id))
-                        except EstimateEntry.DoesNotExist:
-                            pass
+                            processed_entry_ids.add(entry.pk)
                     else:
-                        # Create new entry
-                        EstimateEntry.objects.create(
-                            estimate=estimate,
-                            date=date,
-                            hours=qty_dec,
-                            asset=None,
-                            employee=None,
-                            material_description=full_desc,
-                            material_cost=cost_dec,
-                            description=f"Material: {full_desc}",
+                        new_entries.append(
+                            EstimateEntry(
+                                estimate=estimate,
+                                date=date,
+                                hours=hours_dec,
+                                asset=asset,
+                                employee=employee,
+                                material_description="",
+                                material_cost=None,
+                                description=desc or "",
+                            )
                         )
 
-            # Process services entries
-            service_descriptions = request.POST.getlist("service_description[]")
-            service_quantities = request.POST.getlist("service_quantity[]")
-            service_units = request.POST.getlist("service_unit[]")
-            service_costs = request.POST.getlist("service_cost[]")
-            service_markups = request.POST.getlist("service_markup[]")
-            service_entry_ids = request.POST.getlist("service_entry_id[]")
-
-            for i, (desc, qty, unit, cost, markup, entry_id) in enumerate(zip(
-                service_descriptions, service_quantities, service_units,
-                service_costs, service_markups, service_entry_ids
-            )):
-                if not desc or not qty or not cost:
-                    continue
-
-                qty_dec = Decimal(qty or 0)
-                cost_dec = Decimal(cost or 0)
-                markup_dec = Decimal(markup or 0)
-
-                if desc and qty_dec > 0 and cost_dec > 0:
-                    suffix = f"({qty_dec} {unit})" if unit else ""
-                    desc_stripped = desc.strip()
-                    full_desc = (
-                        f"{desc_stripped} {suffix}".strip()
-                        if suffix and not desc_stripped.endswith(suffix)
-                        else desc_stripped
-                    )
+                # Process materials entries
+                material_descriptions = request.POST.getlist("material_description[]")
+                material_quantities = request.POST.getlist("material_quantity[]")
+                material_units = request.POST.getlist("material_unit[]")
+                material_costs = request.POST.getlist("material_cost[]")
+                material_entry_ids = request.POST.getlist("material_entry_id[]")
 
-                    if entry_id:
-                        # Update existing entry
-                        try:
-                            entry = EstimateEntry.objects.get(pk=entry_id, estimate=estimate)
-                            entry.hours = qty_dec
-                            entry.material_description = full_desc
-                            entry.material_cost = cost_dec
-                            entry.service_markup = markup_dec
-                            entry.description = f"Outside Service: {full_desc}"
-                            entry.asset = None
-                            entry.employee = None
-                            entry.save()
-                            processed_service_ids.add(int(entry_id))
-                        except EstimateEntry.DoesNotExist:
-                            pass
-                    else:
-                        # Create new entry
-                        EstimateEntry.objects.create(
-                            estimate=estimate,
-                            date=date,
-                            hours=qty_dec,
-                            asset=None,
-                            employee=None,
-                            material_description=full_desc,
-                            material_cost=cost_dec,
-                            service_markup=markup_dec,
-                            description=f"Outside Service: {full_desc}",
+                for i, (desc, qty, unit, cost, entry_id) in enumerate(zip(
+                    material_descriptions, material_quantities, material_units, 
+                    material_costs, material_entry_ids
+                )):
+                    if not desc or not qty or not cost:
+                        continue
+
+                    qty_dec = Decimal(qty or 0)
+                    cost_dec = Decimal(cost or 0)
+
+                    if desc and qty_dec > 0 and cost_dec > 0:
+                        suffix = f"({qty_dec} {unit})" if unit else ""
+                        desc_stripped = desc.strip()
+                        full_desc = (
+                            f"{desc_stripped} {suffix}".strip()
+                            if suffix and not desc_stripped.endswith(suffix)
+                            else desc_stripped
+                        )
+
+                        if entry_id:
+                            # Update existing entry
+                            entry = existing_entries.get(entry_id)
+                            if entry is not None:
+                                entry.hours = qty_dec
+                                entry.material_description = full_desc
+                                entry.material_cost = cost_dec
+                                entry.description = f"Material: {full_desc}"
+                                entry.asset = None
+                                entry.employee = None
+                                entry.save()
+                                processed_material_ids.add(entry.pk)
+                        else:
+                            new_entries.append(
+                                EstimateEntry(
+                                    estimate=estimate,
+                                    date=date,
+                                    hours=qty_dec,
+                                    asset=None,
+                                    employee=None,
+                                    material_description=full_desc,
+                                    material_cost=cost_dec,
+                                    description=f"Material: {full_desc}",
+                                )
+                            )
+
+                # Process services entries
+                service_descriptions = request.POST.getlist("service_description[]")
+                service_quantities = request.POST.getlist("service_quantity[]")
+                service_units = request.POST.getlist("service_unit[]")
+                service_costs = request.POST.getlist("service_cost[]")
+                service_markups = request.POST.getlist("service_markup[]")
+                service_entry_ids = request.POST.getlist("service_entry_id[]")
+
+                for i, (desc, qty, unit, cost, markup, entry_id) in enumerate(zip(
+                    service_descriptions, service_quantities, service_units,
+                    service_costs, service_markups, service_entry_ids
+                )):
+                    if not desc or not qty or not cost:
+                        continue
+
+                    qty_dec = Decimal(qty or 0)
+                    cost_dec = Decimal(cost or 0)
+                    markup_dec = Decimal(markup or 0)
+
+                    if desc and qty_dec > 0 and cost_dec > 0:
+                        suffix = f"({qty_dec} {unit})" if unit else ""
+                        desc_stripped = desc.strip()
+                        full_desc = (
+                            f"{desc_stripped} {suffix}".strip()
+                            if suffix and not desc_stripped.endswith(suffix)
+                            else desc_stripped
                         )
 
-            # Delete entries that were removed (not in processed lists)
-            all_entry_ids = set(estimate.entries.values_list('id', flat=True))
-            to_delete = all_entry_ids - processed_entry_ids - processed_material_ids - processed_service_ids
-            if to_delete:
-                EstimateEntry.objects.filter(id__in=to_delete).delete()
+                        if entry_id:
+                            # Update existing entry
+                            entry = existing_entries.get(entry_id)
+                            if entry is not None:
+                                entry.hours = qty_dec
+                                entry.material_description = full_desc
+                                entry.material_cost = cost_dec
+                                entry.service_markup = markup_dec
+                                entry.description = f"Outside Service: {full_desc}"
+                                entry.asset = None
+                                entry.employee = None
+                                entry.save()
+                                processed_service_ids.add(entry.pk)
+                        else:
+                            new_entries.append(
+                                EstimateEntry(
+                                    estimate=estimate,
+                                    date=date,
+                                    hours=qty_dec,
+                                    asset=None,
+                                    employee=None,
+                                    material_description=full_desc,
+                                    material_cost=cost_dec,
+                                    service_markup=markup_dec,
+                                    description=f"Outside Service: {full_desc}",
+                                )
+                            )
+
+                # Delete entries that were removed (not in processed lists). The new
+                # rows are only inserted afterwards, so they are never counted as
+                # removed; bulk_create skips save(), so their amounts are set first.
+                for entry in new_entries:
+                    entry.calculate_amounts()
+                all_entry_ids = {entry.pk for entry in existing_entries.values()}
+                to_delete = all_entry_ids - processed_entry_ids - processed_material_ids - processed_service_ids
+                if to_delete:
+                    EstimateEntry.objects.filter(id__in=to_delete).delete()
+                EstimateEntry.objects.bulk_create(new_entries, batch_size=200)
 
             messages.success(request, f"Estimate '{estimate.name}' updated successfully.")
             return redirect("dashboard:estimate_list")
@@ -1804,11 +2193,11 @@ def duplicate_estimate(request, pk):
     if missing_response:
         return missing_response
 
-    original = get_object_or_404(Estimate, pk=pk, contractor=contractor)
+    original = get_object_or_404(contractor.estimates, pk=pk)
 
     if request.method == "POST":
-        # Create duplicate estimate
-        duplicate = Estimate.objects.create(
+        # Create duplicate estimate; it is saved together with its entries below.
+        duplicate = Estimate(
             contractor=contractor,
             name=f"{original.name} (Copy)",
             customer_name=original.customer_name,
@@ -1822,13 +2211,14 @@ def duplicate_estimate(request, pk):
             special_terms=original.special_terms,
             liability_statement=original.liability_statement,
             notes=original.notes,
-            created_date=timezone.now().date(),
+            created_date=timezone.localdate(),
             valid_until=None,
         )
 
-        # Duplicate all entries
-        for entry in original.entries.all():
-            EstimateEntry.objects.create(
+        # Duplicate all entries, repriced at the current rates like save()
+        # would, in one INSERT.
+        copies = [
+            EstimateEntry(
                 estimate=duplicate,
                 date=duplicate.created_date,
                 hours=entry.hours,
@@ -1839,6 +2229,13 @@ def duplicate_estimate(request, pk):
                 service_markup=entry.service_markup,
                 description=entry.description,
             )
+            for entry in original.entries.select_related("asset", "employee")
+        ]
+        for copy in copies:
+            copy.calculate_amounts()
+        with transaction.atomic():
+            duplicate.save()
+            EstimateEntry.objects.bulk_create(copies, batch_size=200)
 
         messages.success(request, f"Estimate duplicated as '{duplicate.name}'.")
         return redirect("dashboard:edit_estimate", pk=duplicate.pk)
@@ -1852,42 +2249,65 @@ def email_estimate(request, pk):
     if missing_response:
         return missing_response
 
-    estimate = get_object_or_404(Estimate, pk=pk, contractor=contractor)
+    estimate = get_object_or_404(contractor.estimates, pk=pk)
     
     # TODO: Implement email functionality
     messages.info(request, "Email functionality will be implemented in a future update.")
     return redirect("dashboard:estimate_list")
 
 
+def _customer_line_items(entries):
+    """Split entries into the labor, material and service groups shown to customers.
+
+    Labor and equipment only appear as a single total, so those rows are summed
+    straight from ``values_list``; material and service rows are rendered line by
+    line and only load the columns the template prints.
+    """
+    labor_equipment_entries = entries.filter(
+        Q(asset__isnull=False) | Q(employee__isnull=False)
+    ).exclude(material_description__isnull=False, material_description__gt="")
+
+    line_items = entries.filter(
+        material_description__isnull=False, material_description__gt=""
+    ).only(*LINE_ITEM_FIELDS)
+    material_entries = list(line_items.filter(description__startswith="Material:"))
+    service_entries = list(
+        line_items.filter(description__startswith="Outside Service:")
+    )
+
+    labor_equipment_total = sum(
+        (amount or 0)
+        for amount in labor_equipment_entries.values_list("billable_amount", flat=True)
+    )
+    materials_total = sum((entry.billable_amount or 0) for entry in material_entries)
+    services_total = sum((entry.billable_amount or 0) for entry in service_entries)
+    return (
+        labor_equipment_entries,
+        material_entries,
+        service_entries,
+        labor_equipment_total,
+        materials_total,
+        services_total,
+    )
+
+
 @login_required
 def customer_estimate_report(request, pk):
     contractor, missing_response = require_contractor(request)
     if missing_response:
         return missing_response
 
-    estimate = get_object_or_404(Estimate, pk=pk, contractor=contractor)
+    estimate = get_object_or_404(contractor.estimates, pk=pk)
     
     # Group entries for customer presentation
-    labor_equipment_entries = estimate.entries.filter(
-        Q(asset__isnull=False) | Q(employee__isnull=False)
-    ).exclude(material_description__isnull=False, material_description__gt='')
-    
-    material_entries = estimate.entries.filter(
-        material_description__isnull=False,
-        material_description__gt='',
-        description__startswith='Material:'
-    )
-    
-    service_entries = estimate.entries.filter(
-        material_description__isnull=False,
-        material_description__gt='',
-        description__startswith='Outside Service:'
-    )
-    
-    # Calculate totals
-    labor_equipment_total = sum((entry.billable_amount or 0) for entry in labor_equipment_entries)
-    materials_total = sum((entry.billable_amount or 0) for entry in material_entries)
-    services_total = sum((entry.billable_amount or 0) for entry in service_entries)
+    (
+        labor_equipment_entries,
+        material_entries,
+        service_entries,
+        labor_equipment_total,
+        materials_total,
+        services_total,
+    ) = _customer_line_items(estimate.entries.all())
     grand_total = labor_equipment_total + materials_total + services_total
 
     export_pdf = request.GET.get("export") == "pdf"
@@ -1937,27 +2357,16 @@ def customer_invoice_report(request, pk):
     if missing_response:
         return missing_response
 
-    project = get_object_or_404(Project, pk=pk, contractor=contractor)
-
-    labor_equipment_entries = project.job_entries.filter(
-        Q(asset__isnull=False) | Q(employee__isnull=False)
-    ).exclude(material_description__isnull=False, material_description__gt="")
-
-    material_entries = project.job_entries.filter(
-        material_description__isnull=False,
-        material_description__gt="",
-        description__startswith="Material:",
-    )
-
-    service_entries = project.job_entries.filter(
-        material_description__isnull=False,
-        material_description__gt="",
-        description__startswith="Outside Service:",
-    )
+    project = get_object_or_404(contractor.projects, pk=pk)
 
-    labor_equipment_total = sum((entry.billable_amount or 0) for entry in labor_equipment_entries)
-    materials_total = sum((entry.billable_amount or 0) for entry in material_entries)
-    services_total = sum((entry.billable_amount or 0) for entry in service_entries)
+    (
+        labor_equipment_entries,
+        material_entries,
+        service_entries,
+        labor_equipment_total,
+        materials_total,
+        services_total,
+    ) = _customer_line_items(project.job_entries.all())
     grand_total = labor_equipment_total + materials_total + services_total
 
     export_pdf = request.GET.get("export") == "pdf"
@@ -1999,7 +2408,7 @@ def customer_invoice_report(request, pk):
         "document_title": "Invoice",
         "document_type_label": "INVOICE",
         "document_number": invoice_number,
-        "document_date": timezone.now().date(),
+        "document_date": timezone.localdate(),
         "document_valid_until": None,
         "show_acceptance": False,
     }
@@ -2023,36 +2432,48 @@ def internal_estimate_report(request, pk):
     if missing_response:
         return missing_response
 
-    estimate = get_object_or_404(Estimate, pk=pk, contractor=contractor)
-    entries = list(estimate.entries.all().order_by("-date"))
+    estimate = get_object_or_404(contractor.estimates, pk=pk)
+    entries = list(
+        estimate.entries.select_related("asset", "employee")
+        .only(*INTERNAL_ESTIMATE_ENTRY_FIELDS)
+        .order_by("-date")
+    )
     
-    # Calculate detailed totals and margins
-    total_billable = estimate.total_billable
-    total_cost = estimate.total_cost
-    total_profit = estimate.total_profit
-    overall_margin = estimate.profit_margin
+    # Calculate detailed totals and margins from the rows already loaded rather
+    # than the Estimate properties, which re-query every entry on each access.
+    total_billable = sum((entry.billable_amount or 0) for entry in entries)
+    total_cost = sum((entry.cost_amount or 0) for entry in entries)
+    total_profit = total_billable - total_cost
+    overall_margin = (total_profit / total_billable) * 100 if total_billable else 0
 
-    # Category breakdowns
-    labor_cost = equipment_cost = material_cost = service_cost = Decimal("0")
-    labor_billable = equipment_billable = material_billable = service_billable = Decimal("0")
+    # Category breakdowns. Rates, hours and amounts are already Decimals, so
+    # the loop reads them directly and adds the shared ZERO for empty values
+    # instead of parsing a new Decimal("0") per row.
+    labor_cost = equipment_cost = material_cost = service_cost = ZERO
+    labor_billable = equipment_billable = material_billable = service_billable = ZERO
 
     for entry in entries:
-        if entry.asset and not entry.material_description:
-            equipment_cost += (entry.asset.cost_rate * entry.hours) if entry.asset else Decimal("0")
-            equipment_billable += (entry.asset.billable_rate * entry.hours) if entry.asset else Decimal("0")
-        
-        if entry.employee and not entry.material_description:
-            labor_cost += (entry.employee.cost_rate * entry.hours) if entry.employee else Decimal("0")
-            labor_billable += (entry.employee.billable_rate * entry.hours) if entry.employee else Decimal("0")
-        
+        hours = entry.hours
         if entry.material_description:
-            mat_cost = (entry.material_cost * entry.hours) if entry.material_cost else Decimal("0")
+            mat_cost = (entry.material_cost * hours) if entry.material_cost else ZERO
+            billable = entry.billable_amount or ZERO
             if "Outside Service:" in entry.description:
                 service_cost += mat_cost
-                service_billable += entry.billable_amount or Decimal("0")
+                service_billable += billable
             else:
                 material_cost += mat_cost
-                material_billable += entry.billable_amount or Decimal("0")
+                material_billable += billable
+            continue
+
+        asset = entry.asset
+        if asset is not None:
+            equipment_cost += asset.cost_rate * hours
+            equipment_billable += asset.billable_rate * hours
+
+        employee = entry.employee
+        if employee is not None:
+            labor_cost += employee.cost_rate * hours
+            labor_billable += employee.billable_rate * hours
 
     export_pdf = request.GET.get("export") == "pdf"
 
@@ -2092,6 +2513,49 @@ def internal_estimate_report(request, pk):
     return render(request, "dashboard/internal_estimate_report.html", context)
 
 
+def _project_rollup(project):
+    """Return a project's weekly sums and category/overall totals.
+
+    ``weeks`` maps a week index, counted from the project start date, to the
+    (hours, billable, cost) of that week's non-material entries. ``totals``
+    covers every entry. Both come from one GROUP BY date query; sums are kept
+    as Decimal while accumulating and handed back as floats for the chart.
+    """
+    weeks = {}
+    totals = dict.fromkeys(("labor", "equipment", "materials", "billable", "cost"), ZERO)
+    daily_totals = (
+        project.job_entries.order_by()
+        .values("date")
+        .annotate(
+            week_hours=Sum("hours", filter=Q(material_description="")),
+            week_billable=Sum("billable_amount", filter=Q(material_description="")),
+            week_cost=Sum("cost_amount", filter=Q(material_description="")),
+            labor=Sum("billable_amount", filter=Q(employee__isnull=False)),
+            equipment=Sum("billable_amount", filter=Q(asset__isnull=False)),
+            materials=Sum("billable_amount", filter=~Q(material_description="")),
+            billable=Sum("billable_amount"),
+            cost=Sum("cost_amount"),
+        )
+    )
+    for row in daily_totals:
+        for key in totals:
+            totals[key] += row[key] or 0
+        index = (row["date"] - project.start_date).days // 7
+        if index >= 0:
+            hours, billable, cost = weeks.get(index, (ZERO, ZERO, ZERO))
+            weeks[index] = (
+                hours + (row["week_hours"] or 0),
+                billable + (row["week_billable"] or 0),
+                cost + (row["week_cost"] or 0),
+            )
+    return {
+        "weeks": {
+            index: tuple(map(float, sums)) for index, sums in weeks.items()
+        },
+        "totals": {key: float(value) for key, value in totals.items()},
+    }
+
+
 @login_required
 def project_analytics_data(request, pk):
     """API endpoint for project analytics data"""
@@ -2099,76 +2563,67 @@ def project_analytics_data(request, pk):
     if contractor is None:
         return JsonResponse({"error": "Unauthorized"}, status=401)
 
-    project = get_object_or_404(Project, pk=pk, contractor=contractor)
+    project = get_object_or_404(
+        contractor.projects.only("contractor", "start_date", "updated_at"), pk=pk
+    )
 
-    # Weekly breakdown
+    # The per-week rollup only changes when an entry does, and updated_at
+    # moves whenever an entry is saved or deleted. Which weeks are shown
+    # depends on today, so that part is applied to the cached rollup below.
+    cache_key = "project_analytics:{}:{}".format(
+        project.pk, project.updated_at.timestamp()
+    )
+    # The same pair also identifies the response body, so a polling client
+    # that already has it gets a 304 before the rollup is even looked up.
+    today = timezone.localdate()
+    etag = '"{}:{}"'.format(cache_key, today.isoformat())
+    not_modified = get_conditional_response(request, etag=etag)
+    if not_modified is not None:
+        return not_modified
+
+    # No EXISTS probe first: for a project without entries the rollup's single
+    # GROUP BY is just as cheap, and its empty result is cached like any other.
+    rollup = cache.get_or_set(cache_key, partial(_project_rollup, project), 60 * 60)
+
+    # Weeks without entries are zero-filled here rather than with a
+    # generate_series() join: the rollup is sparse and already cached, and the
+    # same code keeps working on SQLite. The cached sums are already floats,
+    # so building the response does no per-week conversions.
+    no_work = (0.0, 0.0, 0.0)
     weekly_data = []
-    current_date = timezone.now().date()
-    start_date = project.start_date
-
-    while start_date <= current_date:
-        end_date = start_date + timedelta(days=6)
-
-        week_entries = project.job_entries.filter(
-            date__range=[start_date, end_date], material_description=""
-        )
-        week_hours = week_entries.aggregate(hours=Sum("hours"))["hours"] or 0
-        week_billable = (
-            week_entries.aggregate(total=Sum("billable_amount"))["total"] or 0
-        )
-        week_cost = week_entries.aggregate(total=Sum("cost_amount"))["total"] or 0
-
+    week_starts = _week_starts(project.start_date, today)
+    for index, week_start in enumerate(week_starts):
+        hours, billable, cost = rollup["weeks"].get(index, no_work)
         weekly_data.append(
             {
-                "week": f"{start_date.strftime('%b %d')}",
-                "hours": float(week_hours),
-                "billable": float(week_billable),
-                "cost": float(week_cost),
+                "week": week_start.strftime("%b %d"),
+                "hours": hours,
+                "billable": billable,
+                "cost": cost,
             }
         )
 
-        start_date += timedelta(weeks=1)
-
-    # Category breakdown
-    labor_total = (
-        project.job_entries.filter(employee__isnull=False).aggregate(
-            total=Sum("billable_amount")
-        )["total"]
-        or 0
-    )
-    equipment_total = (
-        project.job_entries.filter(asset__isnull=False).aggregate(
-            total=Sum("billable_amount")
-        )["total"]
-        or 0
-    )
-    materials_total = (
-        project.job_entries.exclude(material_description="").aggregate(
-            total=Sum("billable_amount")
-        )["total"]
-        or 0
-    )
-
-    return JsonResponse(
+    # Sent as one JSON document rather than streamed in parts: everything
+    # above comes from the cached rollup, so the body is ready as soon as the
+    # project row is, and a buffered response keeps the ETag usable.
+    totals = rollup["totals"]
+    response = _json_response(
         {
             "weekly_data": weekly_data,
             "category_breakdown": {
-                "labor": float(labor_total),
-                "equipment": float(equipment_total),
-                "materials": float(materials_total),
+                "labor": totals["labor"],
+                "equipment": totals["equipment"],
+                "materials": totals["materials"],
             },
             "totals": {
-                "billable": float(
-                    project.job_entries.aggregate(total=Sum("billable_amount"))["total"]
-                    or 0
-                ),
-                "cost": float(
-                    project.job_entries.aggregate(total=Sum("cost_amount"))["total"]
-                    or 0
-                ),
+                "billable": totals["billable"],
+                "cost": totals["cost"],
             },
         }
     )
+    response["ETag"] = etag
+    patch_cache_control(response, private=True)
+    return response
 
 
 @login_required
@@ -2177,72 +2632,69 @@ def add_estimate_entry(request, pk):
     if missing_response:
         return missing_response
 
-    estimate = get_object_or_404(Estimate, pk=pk, contractor=contractor)
+    estimate = get_object_or_404(contractor.estimates, pk=pk)
     assets = contractor.assets.all()
     employees = contractor.employees.all()
 
     if request.method == "POST":
         date = request.POST.get("date")
-        entries_created = 0
+        new_entries = []
 
         # Process labor/equipment entries
-        hours_list = request.POST.getlist("hours[]") or request.POST.getlist("hours")
-        asset_ids = request.POST.getlist("asset[]") or request.POST.getlist("asset")
-        employee_ids = request.POST.getlist("employee[]") or request.POST.getlist("employee")
-        descriptions = request.POST.getlist("description[]") or request.POST.getlist("description")
+        labor_entries = _posted_rows(
+            request.POST, "hours", "asset", "employee", "description"
+        )
+        assets_by_pk = _by_pk(assets, [row[1] for row in labor_entries])
+        employees_by_pk = _by_pk(employees, [row[2] for row in labor_entries])
 
-        labor_entries = zip(hours_list, asset_ids, employee_ids, descriptions)
         for hours, asset_id, employee_id, desc in labor_entries:
             if not any([hours, asset_id, employee_id, desc]):
                 continue
 
-            asset = assets.filter(pk=asset_id).first() if asset_id else None
-            employee = employees.filter(pk=employee_id).first() if employee_id else None
+            asset = assets_by_pk.get(asset_id) if asset_id else None
+            employee = employees_by_pk.get(employee_id) if employee_id else None
             hours_dec = Decimal(hours or 0)
 
             if hours_dec > 0 or asset or employee:
-                EstimateEntry.objects.create(
-                    estimate=estimate,
-                    date=date,
-                    hours=hours_dec,
-                    asset=asset,
-                    employee=employee,
-                    material_description="",
-                    material_cost=None,
-                    description=desc or "",
+                new_entries.append(
+                    EstimateEntry(
+                        estimate=estimate,
+                        date=date,
+                        hours=hours_dec,
+                        asset=asset,
+                        employee=employee,
+                        material_description="",
+                        material_cost=None,
+                        description=desc or "",
+                    )
                 )
-                entries_created += 1
 
         # Process materials entries
-        material_descriptions = request.POST.getlist("material_description[]")
-        material_quantities = request.POST.getlist("material_quantity[]")
-        material_units = request.POST.getlist("material_unit[]")
-        material_costs = request.POST.getlist("material_cost[]")
-
-        if material_descriptions:
-            materials = zip(
-                material_descriptions,
-                material_quantities,
-                material_units,
-                material_costs,
-            )
-            for desc, qty, unit, cost in materials:
-                if not any([desc, qty, cost]):
-                    continue
-
-                qty_dec = Decimal(qty or 0)
-                cost_dec = Decimal(cost or 0)
-
-                if desc and qty_dec > 0 and cost_dec > 0:
-                    suffix = f"({qty_dec} {unit})" if unit else ""
-                    desc_stripped = desc.strip()
-                    full_desc = (
-                        f"{desc_stripped} {suffix}".strip()
-                        if suffix and not desc_stripped.endswith(suffix)
-                        else desc_stripped
-                    )
+        materials = _posted_rows(
+            request.POST,
+            "material_description",
+            "material_quantity",
+            "material_unit",
+            "material_cost",
+        )
+        for desc, qty, unit, cost in materials:
+            if not any([desc, qty, cost]):
+                continue
 
-                    EstimateEntry.objects.create(
+            qty_dec = Decimal(qty or 0)
+            cost_dec = Decimal(cost or 0)
+
+            if desc and qty_dec > 0 and cost_dec > 0:
+                suffix = f"({qty_dec} {unit})" if unit else ""
+                desc_stripped = desc.strip()
+                full_desc = (
+                    f"{desc_stripped} {suffix}".strip()
+                    if suffix and not desc_stripped.endswith(suffix)
+                    else desc_stripped
+                )
+
+                new_entries.append(
+                    EstimateEntry(
                         estimate=estimate,
                         date=date,
                         hours=qty_dec,
@@ -2252,41 +2704,36 @@ def add_estimate_entry(request, pk):
                         material_cost=cost_dec,
                         description=f"Material: {full_desc}",
                     )
-                    entries_created += 1
+                )
 
         # Process services entries
-        service_descriptions = request.POST.getlist("service_description[]")
-        service_quantities = request.POST.getlist("service_quantity[]")
-        service_units = request.POST.getlist("service_unit[]")
-        service_costs = request.POST.getlist("service_cost[]")
-        service_markups = request.POST.getlist("service_markup[]")
-
-        if service_descriptions:
-            services = zip(
-                service_descriptions,
-                service_quantities,
-                service_units,
-                service_costs,
-                service_markups,
-            )
-            for desc, qty, unit, cost, markup in services:
-                if not any([desc, qty, cost]):
-                    continue
-
-                qty_dec = Decimal(qty or 0)
-                cost_dec = Decimal(cost or 0)
-                markup_dec = Decimal(markup or 0)
-
-                if desc and qty_dec > 0 and cost_dec > 0:
-                    suffix = f"({qty_dec} {unit})" if unit else ""
-                    desc_stripped = desc.strip()
-                    full_desc = (
-                        f"{desc_stripped} {suffix}".strip()
-                        if suffix and not desc_stripped.endswith(suffix)
-                        else desc_stripped
-                    )
+        services = _posted_rows(
+            request.POST,
+            "service_description",
+            "service_quantity",
+            "service_unit",
+            "service_cost",
+            "service_markup",
+        )
+        for desc, qty, unit, cost, markup in services:
+            if not any([desc, qty, cost]):
+                continue
 
-                    EstimateEntry.objects.create(
+            qty_dec = Decimal(qty or 0)
+            cost_dec = Decimal(cost or 0)
+            markup_dec = Decimal(markup or 0)
+
+            if desc and qty_dec > 0 and cost_dec > 0:
+                suffix = f"({qty_dec} {unit})" if unit else ""
+                desc_stripped = desc.strip()
+                full_desc = (
+                    f"{desc_stripped} {suffix}".strip()
+                    if suffix and not desc_stripped.endswith(suffix)
+                    else desc_stripped
+                )
+
+                new_entries.append(
+                    EstimateEntry(
                         estimate=estimate,
                         date=date,
                         hours=qty_dec,
@@ -2297,7 +2744,13 @@ def add_estimate_entry(request, pk):
                         service_markup=markup_dec,
                         description=f"Outside Service: {full_desc}",
                     )
-                    entries_created += 1
+                )
+
+        for entry in new_entries:
+            entry.calculate_amounts()
+        with transaction.atomic():
+            EstimateEntry.objects.bulk_create(new_entries, batch_size=200)
+        entries_created = len(new_entries)
 
         if entries_created > 0:
             messages.success(
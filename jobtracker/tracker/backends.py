@@ -16,3 +16,13 @@ class EmailBackend(ModelBackend):
             if user.check_password(password) and self.user_can_authenticate(user):
                 return user
         return None
+
+    def get_user(self, user_id):
+        # Load the contractor in the same query as the session user, since
+        # nearly every view reads request.user.contractor straight away.
+        UserModel = get_user_model()
+        try:
+            user = UserModel._default_manager.select_related('contractor').get(pk=user_id)
+        except UserModel.DoesNotExist:
+            return None
+        return user if self.user_can_authenticate(user) else None
@@ -0,0 +1,46 @@
+from django.db import migrations
+
+# Columns searched with ``icontains``. On PostgreSQL a trigram GIN index lets
+# ``UPPER(col) LIKE UPPER('%term%')`` use an index instead of a table scan.
+TRIGRAM_INDEXES = [
+    ("tracker_project_name_trgm", "tracker_project", "name"),
+    ("tracker_jobentry_description_trgm", "tracker_jobentry", "description"),
+    (
+        "tracker_jobentry_material_description_trgm",
+        "tracker_jobentry",
+        "material_description",
+    ),
+    ("tracker_asset_name_trgm", "tracker_asset", "name"),
+    ("tracker_employee_name_trgm", "tracker_employee", "name"),
+]
+
+
+def create_trigram_indexes(apps, schema_editor):
+    if schema_editor.connection.vendor != "postgresql":
+        return
+    schema_editor.execute("CREATE EXTENSION IF NOT EXISTS pg_trgm")
+    for name, table, column in TRIGRAM_INDEXES:
+        # Django's icontains lookup compares UPPER() on both sides, so index
+        # the same expression.
+        schema_editor.execute(
+            f"CREATE INDEX IF NOT EXISTS {name} ON {table} "
+            f"USING gin (UPPER({column}) gin_trgm_ops)"
+        )
+
+
+def drop_trigram_indexes(apps, schema_editor):
+    if schema_editor.connection.vendor != "postgresql":
+        return
+    for name, _table, _column in TRIGRAM_INDEXES:
+        schema_editor.execute(f"DROP INDEX IF EXISTS {name}")
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("tracker", "0010_estimate_customer_address_estimate_customer_email_and_more"),
+    ]
+
+    operations = [
+        migrations.RunPython(create_trigram_indexes, drop_trigram_indexes),
+    ]
@@ -0,0 +1,21 @@
+# Generated by Django 5.2.18 on 2026-10-15 23:10
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('tracker', '0012_project_updated_at'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='jobentry',
+            index=models.Index(fields=['project', '-date'], name='je_proj_date_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='payment',
+            index=models.Index(fields=['project', '-date'], name='pay_proj_date_idx'),
+        ),
+    ]
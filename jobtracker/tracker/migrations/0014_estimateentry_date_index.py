@@ -0,0 +1,17 @@
+# Generated by Django 5.2.18 on 2026-10-15 23:44
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('tracker', '0013_project_date_indexes'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='estimateentry',
+            index=models.Index(fields=['estimate', '-date'], name='est_entry_date_idx'),
+        ),
+    ]
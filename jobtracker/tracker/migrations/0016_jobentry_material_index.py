@@ -0,0 +1,17 @@
+# Generated by Django 5.2.18 on 2026-10-16 00:45
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('tracker', '0014_estimateentry_date_index'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='jobentry',
+            index=models.Index(condition=models.Q(('material_description', ''), _negated=True), fields=['project', '-date'], name='je_proj_material_idx'),
+        ),
+    ]
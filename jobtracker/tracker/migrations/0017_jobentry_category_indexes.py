@@ -0,0 +1,21 @@
+# Generated by Django 5.2.18 on 2026-10-16 01:14
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('tracker', '0016_jobentry_material_index'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='jobentry',
+            index=models.Index(condition=models.Q(('employee__isnull', False)), fields=['project'], name='je_proj_employee_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='jobentry',
+            index=models.Index(condition=models.Q(('asset__isnull', False)), fields=['project'], name='je_proj_asset_idx'),
+        ),
+    ]
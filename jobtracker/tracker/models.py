@@ -1,4 +1,5 @@
 from django.db import models
+from django.db.models.functions import Coalesce
 from django.contrib.auth.models import AbstractUser, BaseUserManager
 from decimal import Decimal
 from django.core.files.base import ContentFile
@@ -134,6 +135,44 @@ class Material(models.Model):
         return self.description
 
 
+def _project_sum(model, field):
+    """Return a per-project ``Sum`` of ``field`` on ``model`` as a subquery."""
+    total = (
+        model.objects.filter(project=models.OuterRef("pk"))
+        .order_by()
+        .values("project")
+        .annotate(total=models.Sum(field))
+        .values("total")
+    )
+    return Coalesce(
+        models.Subquery(
+            total, output_field=models.DecimalField(max_digits=12, decimal_places=2)
+        ),
+        models.Value(Decimal("0")),
+        output_field=models.DecimalField(max_digits=12, decimal_places=2),
+    )
+
+
+class ProjectQuerySet(models.QuerySet):
+    def active(self):
+        """Projects that haven't been closed out with an end date."""
+        return self.filter(end_date__isnull=True)
+
+    def with_totals(self):
+        """Annotate ``total_billable``, ``total_payments`` and ``outstanding``.
+
+        Each total is a correlated subquery so joining entries and payments in
+        the same query can't double count either side.
+        """
+        return self.annotate(
+            total_billable=_project_sum(JobEntry, "billable_amount"),
+            total_payments=_project_sum(Payment, "amount"),
+        ).annotate(outstanding=models.F("total_billable") - models.F("total_payments"))
+
+    def active_with_totals(self):
+        return self.active().with_totals()
+
+
 class Project(models.Model):
     contractor = models.ForeignKey(
         Contractor, related_name="projects", on_delete=models.CASCADE
@@ -149,10 +188,65 @@ class Project(models.Model):
     name = models.CharField(max_length=255)
     start_date = models.DateField()
     end_date = models.DateField(blank=True, null=True)
+    updated_at = models.DateTimeField(auto_now=True)
+
+    objects = ProjectQuerySet.as_manager()
 
     def __str__(self) -> str:
         return self.name
 
+    @classmethod
+    def touch(cls, *pks):
+        """Bump ``updated_at`` so caches keyed on it notice entry/payment changes.
+
+        The dashboard's report, summary and analytics caches are keyed on
+        ``updated_at``, so every write to a project's entries or payments must
+        end here: ``save()``/``delete()`` on the rows call it, and
+        ``ProjectRowQuerySet`` does for bulk ``update()``, ``delete()`` and
+        ``bulk_create()``.
+        """
+        cls.objects.filter(pk__in=pks).update(updated_at=timezone.now())
+
+
+class ProjectRowQuerySet(models.QuerySet):
+    """QuerySet for rows that roll up into their project's cached totals.
+
+    Bulk writes bypass the rows' ``save()`` and ``delete()``, so they touch the
+    affected projects here instead.
+    """
+
+    def _project_ids(self):
+        return set(self.order_by().values_list("project_id", flat=True).distinct())
+
+    def update(self, **kwargs):
+        project_ids = self._project_ids()
+        rows = super().update(**kwargs)
+        if "project" in kwargs:
+            project_ids.add(getattr(kwargs["project"], "pk", kwargs["project"]))
+        if "project_id" in kwargs:
+            project_ids.add(kwargs["project_id"])
+        if rows:
+            Project.touch(*project_ids)
+        return rows
+
+    update.alters_data = True
+
+    def delete(self):
+        project_ids = self._project_ids()
+        result = super().delete()
+        if result[0]:
+            Project.touch(*project_ids)
+        return result
+
+    delete.alters_data = True
+    delete.queryset_only = True
+
+    def bulk_create(self, objs, *args, **kwargs):
+        objs = super().bulk_create(objs, *args, **kwargs)
+        if objs:
+            Project.touch(*{obj.project_id for obj in objs})
+        return objs
+
 
 class Estimate(models.Model):
     contractor = models.ForeignKey(
@@ -213,12 +307,12 @@ class Estimate(models.Model):
 
     def save(self, *args, **kwargs):
         if not self.created_date:
-            self.created_date = timezone.now().date()
+            self.created_date = timezone.localdate()
         elif isinstance(self.created_date, str):
             try:
                 self.created_date = datetime.strptime(self.created_date, "%Y-%m-%d").date()
             except ValueError:
-                self.created_date = timezone.now().date()
+                self.created_date = timezone.localdate()
 
         # Auto-generate estimate number if not provided
         if not self.estimate_number:
@@ -312,10 +406,43 @@ class JobEntry(models.Model):
     billable_amount = models.DecimalField(max_digits=10, decimal_places=2)
     description = models.TextField(blank=True)
 
+    objects = ProjectRowQuerySet.as_manager()
+
+    class Meta:
+        indexes = [
+            models.Index(fields=["project", "-date"], name="je_proj_date_idx"),
+            # Backs the project page's "materials" filter, which would
+            # otherwise read every entry of the project to skip the non-material
+            # ones; the condition matches exclude(material_description="").
+            models.Index(
+                fields=["project", "-date"],
+                name="je_proj_material_idx",
+                condition=~models.Q(material_description=""),
+            ),
+            # Back the labor and equipment filters on the project page and the
+            # per-category sums, which only read a project's employee or
+            # asset rows.
+            models.Index(
+                fields=["project"],
+                name="je_proj_employee_idx",
+                condition=models.Q(employee__isnull=False),
+            ),
+            models.Index(
+                fields=["project"],
+                name="je_proj_asset_idx",
+                condition=models.Q(asset__isnull=False),
+            ),
+        ]
+
     def __str__(self) -> str:
         return f"{self.project.name} - {self.date}"
 
-    def save(self, *args, **kwargs):
+    def calculate_amounts(self):
+        """Populate cost_amount and billable_amount from rates and materials.
+
+        ``save()`` calls this automatically; callers using ``bulk_create`` must
+        call it themselves since that bypasses ``save()``.
+        """
         contractor = self.project.contractor
         self.cost_amount = Decimal("0")
         self.billable_amount = Decimal("0")
@@ -337,7 +464,16 @@ class JobEntry(models.Model):
                 self.billable_amount += material_total / (Decimal("1") - margin)
         self.cost_amount = self.cost_amount.quantize(Decimal("0.01"))
         self.billable_amount = self.billable_amount.quantize(Decimal("0.01"))
+
+    def save(self, *args, **kwargs):
+        self.calculate_amounts()
         super().save(*args, **kwargs)
+        Project.touch(self.project_id)
+
+    def delete(self, *args, **kwargs):
+        result = super().delete(*args, **kwargs)
+        Project.touch(self.project_id)
+        return result
 
 
 class EstimateEntry(models.Model):
@@ -371,10 +507,16 @@ class EstimateEntry(models.Model):
     billable_amount = models.DecimalField(max_digits=10, decimal_places=2)
     description = models.TextField(blank=True)
 
+    class Meta:
+        indexes = [
+            models.Index(fields=["estimate", "-date"], name="est_entry_date_idx"),
+        ]
+
     def __str__(self) -> str:
         return f"Estimate: {self.estimate.name} - {self.date}"
 
-    def save(self, *args, **kwargs):
+    def calculate_amounts(self):
+        """Populate cost_amount and billable_amount; see ``JobEntry.calculate_amounts``."""
         contractor = self.estimate.contractor
         self.cost_amount = Decimal("0")
         self.billable_amount = Decimal("0")
@@ -396,6 +538,9 @@ class EstimateEntry(models.Model):
                 self.billable_amount += material_total / (Decimal("1") - margin)
         self.cost_amount = self.cost_amount.quantize(Decimal("0.01"))
         self.billable_amount = self.billable_amount.quantize(Decimal("0.01"))
+
+    def save(self, *args, **kwargs):
+        self.calculate_amounts()
         super().save(*args, **kwargs)
 
 
@@ -405,5 +550,21 @@ class Payment(models.Model):
     date = models.DateField()
     notes = models.TextField(blank=True)
 
+    objects = ProjectRowQuerySet.as_manager()
+
+    class Meta:
+        indexes = [
+            models.Index(fields=["project", "-date"], name="pay_proj_date_idx"),
+        ]
+
     def __str__(self) -> str:
         return f"{self.project.name} - {self.amount}"
+
+    def save(self, *args, **kwargs):
+        super().save(*args, **kwargs)
+        Project.touch(self.project_id)
+
+    def delete(self, *args, **kwargs):
+        result = super().delete(*args, **kwargs)
+        Project.touch(self.project_id)
+        return result
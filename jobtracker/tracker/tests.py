@@ -1,3 +1,4 @@
+from datetime import datetime, timezone as dt_timezone
 from decimal import Decimal
 
 from django.test import TestCase, RequestFactory
@@ -11,10 +12,12 @@ from tracker.models import (
     Asset,
     Employee,
     JobEntry,
+    Payment,
     ContractorUser,
 )
 from tracker.forms import ContractorForm
 from tracker.admin import ContractorAdmin
+from tracker.backends import EmailBackend
 from tracker import context_processors
 
 
@@ -51,6 +54,112 @@ class JobEntryCalculationTests(TestCase):
         self.assertEqual(entry.cost_amount, Decimal("400"))
         self.assertEqual(entry.billable_amount, Decimal("558.33"))
 
+    def test_saving_and_deleting_entries_bumps_project_updated_at(self):
+        contractor = Contractor.objects.create(
+            name="Test Contractor", email="contractor@example.com"
+        )
+        project = Project.objects.create(
+            contractor=contractor, name="Test Project", start_date="2024-01-01"
+        )
+        created = project.updated_at
+
+        entry = JobEntry.objects.create(
+            project=project, date="2024-01-02", hours=Decimal("1")
+        )
+        project.refresh_from_db()
+        self.assertGreater(project.updated_at, created)
+
+        saved = project.updated_at
+        entry.delete()
+        project.refresh_from_db()
+        self.assertGreater(project.updated_at, saved)
+
+
+class ProjectTouchTests(TestCase):
+    """Every write path for entries and payments must move ``updated_at``."""
+
+    def setUp(self):
+        contractor = Contractor.objects.create(
+            name="Test Contractor", email="contractor@example.com"
+        )
+        self.project = Project.objects.create(
+            contractor=contractor, name="Test Project", start_date="2024-01-01"
+        )
+        self.entry = JobEntry.objects.create(
+            project=self.project, date="2024-01-02", hours=Decimal("1")
+        )
+        self.payment = Payment.objects.create(
+            project=self.project, amount=Decimal("5"), date="2024-01-03"
+        )
+
+    def assertTouches(self, write):
+        stale = datetime(2000, 1, 1, tzinfo=dt_timezone.utc)
+        Project.objects.filter(pk=self.project.pk).update(updated_at=stale)
+        write()
+        self.project.refresh_from_db()
+        self.assertGreater(self.project.updated_at, stale)
+
+    def test_queryset_update_touches_the_project(self):
+        self.assertTouches(
+            lambda: self.project.job_entries.update(description="Edited")
+        )
+        self.assertTouches(
+            lambda: Payment.objects.filter(pk=self.payment.pk).update(notes="Edited")
+        )
+
+    def test_queryset_delete_touches_the_project(self):
+        self.assertTouches(lambda: JobEntry.objects.filter(pk=self.entry.pk).delete())
+        self.assertTouches(lambda: self.project.payments.all().delete())
+
+    def test_bulk_create_touches_the_project(self):
+        self.assertTouches(
+            lambda: JobEntry.objects.bulk_create(
+                [
+                    JobEntry(
+                        project=self.project,
+                        date="2024-01-04",
+                        hours=Decimal("1"),
+                        cost_amount=Decimal("0"),
+                        billable_amount=Decimal("0"),
+                    )
+                ]
+            )
+        )
+        self.assertTouches(
+            lambda: Payment.objects.bulk_create(
+                [Payment(project=self.project, amount=Decimal("1"), date="2024-01-04")]
+            )
+        )
+
+
+class ProjectQuerySetTests(TestCase):
+    def test_active_with_totals_skips_closed_projects_and_sums_each_side(self):
+        contractor = Contractor.objects.create(
+            name="Test Contractor", email="contractor@example.com"
+        )
+        asset = Asset.objects.create(
+            contractor=contractor,
+            name="Excavator",
+            cost_rate=Decimal("10"),
+            billable_rate=Decimal("15"),
+        )
+        active = contractor.projects.create(name="Active", start_date="2024-01-01")
+        contractor.projects.create(
+            name="Closed", start_date="2024-01-01", end_date="2024-02-01"
+        )
+        for day in ("2024-01-02", "2024-01-03"):
+            JobEntry.objects.create(
+                project=active, date=day, hours=Decimal("2"), asset=asset
+            )
+            Payment.objects.create(project=active, date=day, amount=Decimal("10"))
+
+        projects = list(contractor.projects.active_with_totals())
+
+        self.assertEqual([p.name for p in projects], ["Active"])
+        self.assertEqual(projects[0].total_billable, Decimal("60"))
+        self.assertEqual(projects[0].total_payments, Decimal("20"))
+        self.assertEqual(projects[0].outstanding, Decimal("40"))
+
 
 class ContractorAdminTests(TestCase):
     def test_password_creates_user(self):
@@ -89,6 +198,27 @@ class LoginRedirectTests(TestCase):
         self.assertEqual(response.url, "/")
 
 
+class EmailBackendTests(TestCase):
+    def test_get_user_loads_the_contractor_in_the_same_query(self):
+        contractor = Contractor.objects.create(
+            name="Example Contractor", email="user@example.com"
+        )
+        user = ContractorUser.objects.create_user(
+            email="user@example.com", password="secret", contractor=contractor
+        )
+
+        with self.assertNumQueries(1):
+            loaded = EmailBackend().get_user(user.pk)
+            self.assertEqual(loaded.contractor, contractor)
+
+    def test_get_user_returns_none_for_unknown_or_inactive_users(self):
+        user = ContractorUser.objects.create_user(
+            email="user@example.com", password="secret", is_active=False
+        )
+        self.assertIsNone(EmailBackend().get_user(user.pk))
+        self.assertIsNone(EmailBackend().get_user(user.pk + 1))
+
+
 class ContractorContextProcessorTests(TestCase):
     def test_db_errors_do_not_break_templates(self):
         class FakeUser: